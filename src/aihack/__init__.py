@@ -1,5 +1,11 @@
 import warnings
 
-# Suppress the specific NotOpenSSLWarning as early as possible by matching its message.
-# This avoids importing urllib3, which might trigger the warning itself.
-warnings.filterwarnings("ignore", message=".*urllib3 v2 only supports OpenSSL 1.1.1+.*")
+# Suppress urllib3's NotOpenSSLWarning as early as possible. Matching on its
+# message and the emitting module avoids importing urllib3 (which might trigger
+# the warning itself); the anchored module keeps every other urllib3 warning,
+# such as InsecureRequestWarning from its submodules, visible.
+warnings.filterwarnings(
+    "ignore",
+    message=r"urllib3 v2 only supports OpenSSL 1\.1\.1\+",
+    module=r"urllib3\Z",
+)
@@ -1,28 +1,137 @@
 # ai_hack/cli/main.py
 import asyncio
+import contextlib
+import functools
+import mmap
 import os
-import warnings
+import stat
+import sys
+from importlib import resources
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    ContextManager,
+    Coroutine,
+    List,
+    Optional,
+)
 
 import click
-import pyfiglet
-from rich.align import Align
-from rich.console import Console
-from rich.panel import Panel
 
 from aihack.core.tasks import TaskRegistry
-from aihack.models.local import OllamaModel
 
-# Configure environment and warnings
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from aihack.models.local import OllamaModel
+
+# Configure environment for subprocesses (in-process filter lives in aihack/__init__)
 os.environ.setdefault("PYTHONWARNINGS", "ignore::UserWarning:urllib3")
-warnings.filterwarnings("ignore", message=".*urllib3.*OpenSSL.*")
 
-console = Console()
+_console: Optional["Console"] = None
+
+
+def _get_console() -> "Console":
+    """Return the shared Rich console, importing Rich on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+_ollama: Optional["OllamaModel"] = None
+
+
+def _get_ollama() -> "OllamaModel":
+    """Return the process-wide Ollama model so all calls share one HTTP pool."""
+    global _ollama
+    if _ollama is None:
+        from aihack.models.local import OllamaModel
+
+        _ollama = OllamaModel()
+    return _ollama
+
+
+async def _close_ollama() -> None:
+    """Close the shared Ollama client, if one was created."""
+    global _ollama
+    if _ollama is not None:
+        await _ollama.aclose()
+        _ollama = None
+
+
+def _install_uvloop() -> None:
+    """Use uvloop's event loop when it is installed (it has no Windows build)."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+def _run(coro: Coroutine[Any, Any, None]) -> None:
+    """Run a command coroutine, closing pooled connections before the loop ends."""
+    _install_uvloop()
+
+    async def _main() -> None:
+        try:
+            await coro
+        finally:
+            await _close_ollama()
+
+    asyncio.run(_main())
+
+
+# Task registry lookups are static, so resolve them once at import time
+_ALL_TASK_NAMES = tuple(TaskRegistry.get_all_task_names())
+_ALL_TASKS_SET = frozenset(_ALL_TASK_NAMES)
+_ALL_TASKS_JOINED = ", ".join(_ALL_TASK_NAMES)
+_DEFAULT_TASK = TaskRegistry.get_default_task()
+_TASK_CONFIGS = {task: TaskRegistry.get_task_config(task) for task in _ALL_TASK_NAMES}
+
+
+def _read_code_file(path: str) -> str:
+    """Read a source file, decoding regular files from a read-only memory map."""
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        if not (stat.S_ISREG(st.st_mode) and st.st_size > 0):
+            # Pipes, /dev/stdin and /proc files report a size of 0 (and empty
+            # files can't be mapped), so read those as a text stream instead
+            with open(f.fileno(), encoding="utf-8", closefd=False) as text:
+                return text.read()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            # Same universal newline translation as a text-mode read
+            return str(mapped, "utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+@functools.lru_cache(maxsize=1)
+def _ascii_art() -> str:
+    """Load the splash banner, pre-rendered with pyfiglet's "slant" font."""
+    text = resources.files("aihack.cli").joinpath("splash.txt").read_text("utf-8")
+    lines = text.splitlines()
+    # Pad to a common width so centering keeps the glyphs aligned
+    width = max(len(line) for line in lines)
+    return "\n".join(line.ljust(width) for line in lines) + "\n\n"
 
 
 def _show_splash_screen() -> None:
     """Displays the ASCII art splash screen."""
-    ascii_art = pyfiglet.figlet_format("AI-Hack", font="slant")
+    console = _get_console()
     subtitle = "Your Privacy-First AI Coding Partner 🚀"
+
+    # Piped or redirected output gets a plain banner, skipping layout work
+    if not console.is_terminal:
+        print(f"AI-Hack — {subtitle}")
+        print("Type 'ah session' or 'letshack' to begin.")
+        return
+
+    from rich.align import Align
+    from rich.panel import Panel
+
+    ascii_art = _ascii_art()
     tagline = "Type [bold green]ah session[/bold green] or [bold green]letshack[/bold green] to begin."
     message = f"[bold cyan]{ascii_art}[/bold cyan]\n[dim]{subtitle}[/dim]\n\n{tagline}"
 
@@ -50,8 +159,8 @@ def cli(ctx: click.Context) -> None:
 @click.option(
     "-t",
     "--task",
-    default=TaskRegistry.get_default_task(),
-    help=f"Task to perform: {', '.join(TaskRegistry.get_all_task_names())}",
+    default=_DEFAULT_TASK,
+    help=f"Task to perform: {_ALL_TASKS_JOINED}",
 )
 @click.option(
     "-m", "--model", default="local", help="Model to use: local, claude, gemini"
@@ -66,59 +175,78 @@ def cli(ctx: click.Context) -> None:
 )
 def hack(code_file: str, task: str, model: str, verbose: bool, privacy: str) -> None:
     """Quick AI-assisted code analysis and suggestions"""
-    asyncio.run(_hack_async(code_file, task, model, verbose, privacy))
+    _run(_hack_async(code_file, task, model, verbose, privacy))
 
 
 async def _hack_async(
     code_file: str, task: str, model: str, verbose: bool, privacy: str
 ) -> None:
     """Async implementation of hack command"""
-    # Validate task
-    if not TaskRegistry.is_valid_task(task):
-        console.print(f"❌ Invalid task: {task}")
-        console.print(f"Valid tasks: {', '.join(TaskRegistry.get_all_task_names())}")
+    console = _get_console()
+
+    # Validate task (resolving aliases such as "analyse")
+    task = TaskRegistry.resolve_task_alias(task)
+    if task not in _ALL_TASKS_SET:
+        console.print(f"❌ Invalid task: {task}\nValid tasks: {_ALL_TASKS_JOINED}")
         return
 
-    with open(code_file, "r") as f:
-        code = f.read()
+    # Read off the event loop so the disk I/O doesn't block other tasks
+    code = await asyncio.to_thread(_read_code_file, code_file)
+
+    task_config = _TASK_CONFIGS[task]
 
-    task_config = TaskRegistry.get_task_config(task)
+    # Privacy enforcement
+    forced_local = privacy == "high"
+    if forced_local:
+        model = "local"
 
+    # Render the header in a single print rather than one write per line
     if verbose:
-        console.print(f"🔍 {task_config.get('description', 'Processing')} {code_file}")
-        lines = code.split("\n")
-        console.print(f"📊 File stats: {len(lines)} lines, {len(code)} characters")
-        console.print(f"🔒 Privacy level: {privacy}")
+        line_count = code.count("\n") + 1
+        header = [
+            f"🔍 {task_config.get('description', 'Processing')} {code_file}",
+            f"📊 File stats: {line_count} lines, {len(code)} characters",
+            f"🔒 Privacy level: {privacy}",
+        ]
+        if forced_local:
+            header.append("🔒 Privacy mode: forcing local processing")
+        console.print("\n".join(header))
     else:
         console.print(f"🔍 Analyzing {code_file} ({task})...")
 
-    # Privacy enforcement
-    if privacy == "high":
-        model = "local"
-        if verbose:
-            console.print("🔒 Privacy mode: forcing local processing")
-
     if model == "local":
-        with console.status("[bold green]Connecting to local AI model...") as status:
-            local_ai = OllamaModel()
-
-            # Check if Ollama is available
-            if not await local_ai.is_available():
+        from aihack.models.base import ModelTimeoutError, ModelUnavailableError
+
+        local_ai = _get_ollama()
+        tokens = local_ai.code_review_stream(code, task)
+
+        # The spinner only helps on an interactive terminal; skip its render
+        # thread when output is piped or redirected
+        spinner: ContextManager[Any] = contextlib.nullcontext()
+        if console.is_terminal:
+            spinner = console.status("[bold green]Analyzing code with CodeLlama...")
+        with spinner:
+            # Go straight to the request; a refused connection or no first
+            # token before the timeout means Ollama is not running, so no
+            # separate availability probe is needed. The spinner only covers
+            # the wait for the first token.
+            try:
+                first_token = await tokens.__anext__()
+            except StopAsyncIteration:
+                first_token = ""
+            except (ModelUnavailableError, ModelTimeoutError):
                 console.print(
                     "❌ Local model (Ollama) not available. Make sure it's running."
+                    "\n💡 Try: ollama serve"
                 )
-                console.print("💡 Try: ollama serve")
                 return
 
-            status.update("[bold green]Analyzing code with CodeLlama...")
-
-            if TaskRegistry.is_valid_task(task):
-                response = await local_ai.code_review(code, task)
-            else:
-                response = await local_ai.analyze_code(code)
-
+        # Print tokens as they arrive so output starts at time-to-first-token
         console.print("\n🤖 [bold blue]AI Analysis:[/bold blue]")
-        console.print(response)
+        console.print(first_token, end="", soft_wrap=True, markup=False)
+        async for token in tokens:
+            console.print(token, end="", soft_wrap=True, markup=False)
+        console.print()
 
     else:
         console.print(f"⚠️  Model '{model}' not yet implemented. Using local for now.")
@@ -136,7 +264,7 @@ def review(code_file: str, model: str, verbose: bool, security: bool) -> None:
     """Code review with AI assistance (alias for hack --task review)"""
     task = "security" if security else "review"
     privacy = "high" if security else "balanced"
-    asyncio.run(_hack_async(code_file, task, model, verbose, privacy))
+    _run(_hack_async(code_file, task, model, verbose, privacy))
 
 
 @cli.command("status")
@@ -144,37 +272,47 @@ def review(code_file: str, model: str, verbose: bool, security: bool) -> None:
 @click.option("-a", "--all", "check_all", is_flag=True, help="Check all models")
 def status(verbose: bool, check_all: bool) -> None:
     """Check AI-Hack and model status"""
-    asyncio.run(_status_async(verbose, check_all))
+    _run(_status_async(verbose, check_all))
 
 
 async def _status_async(verbose: bool, check_all: bool) -> None:
     """Check system status"""
+    console = _get_console()
     console.print("🔍 Checking AI-Hack status...")
 
-    # Check local model
-    local_ai = OllamaModel()
-    local_available = await local_ai.is_available()
+    # Run all checks concurrently so latency is the slowest check, not the sum
+    local_ai = _get_ollama()
+    checks: List[Awaitable[Any]] = [local_ai.is_available()]
+    if verbose:
+        checks.append(local_ai.health_check())
+    results = await asyncio.gather(*checks)
+    local_available = results[0]
 
+    # Collect the report and print it in one go
+    report: List[str] = []
     if local_available:
-        console.print("✅ Local model (Ollama) is available")
+        report.append("✅ Local model (Ollama) is available")
         if verbose:
-            health = await local_ai.health_check()
-            console.print(f"   Model: {health.get('model', 'Unknown')}")
-            console.print(f"   Response time: {health.get('response_time_ms', 0)}ms")
+            health = results[1]
+            report.append(f"   Model: {health.get('model', 'Unknown')}")
+            report.append(f"   Response time: {health.get('response_time_ms', 0)}ms")
     else:
-        console.print("❌ Local model (Ollama) not available")
-        console.print("   Try: ollama serve")
+        report.append("❌ Local model (Ollama) not available")
+        report.append("   Try: ollama serve")
 
     if check_all:
-        console.print("⚠️  Cloud model checks not implemented yet")
-        console.print("   Claude: Not configured")
-        console.print("   Gemini: Not configured")
+        report.append("⚠️  Cloud model checks not implemented yet")
+        report.append("   Claude: Not configured")
+        report.append("   Gemini: Not configured")
+
+    console.print("\n".join(report))
 
 
 @cli.command("models")
 @click.option("-v", "--verbose", is_flag=True, help="Show detailed model info")
 def models(verbose: bool) -> None:
     """List available models and their capabilities"""
+    console = _get_console()
     console.print("🤖 Available Models:")
     console.print("   local   - Ollama models (CodeLlama, Mixtral, etc.)")
     console.print("   claude  - Anthropic Claude (not yet implemented)")
@@ -182,8 +320,8 @@ def models(verbose: bool) -> None:
 
     if verbose:
         console.print("\n📋 Task Support:")
-        for task in TaskRegistry.get_all_task_names():
-            config = TaskRegistry.get_task_config(task)
+        for task in _ALL_TASK_NAMES:
+            config = _TASK_CONFIGS[task]
             console.print(
                 f"   {task:<10} - {config.get('description', 'No description')}"
             )
@@ -198,7 +336,15 @@ def session() -> None:
 
 
 def main() -> None:
-    cli()
+    # Fast path for the most common argument-free invocations, skipping
+    # Click's parsing; anything else goes through the full command group
+    args = sys.argv[1:]
+    if not args:
+        _show_splash_screen()
+    elif args == ["status"]:
+        _run(_status_async(verbose=False, check_all=False))
+    else:
+        cli()
 
 
 if __name__ == "__main__":
@@ -1,14 +1,25 @@
 """Runner function for the standalone 'letshack' session command."""
+import time
 
-from aihack.cli.main import _show_splash_screen
-from aihack.cli.session import SessionApp
+from aihack.cli.main import _install_uvloop, _show_splash_screen
+
+# How long the splash stays up, counted from when it is drawn
+SPLASH_SECONDS = 1.0
 
 
 def run() -> None:
     """Entry point function to run the interactive session app."""
+    shown_at = time.monotonic()
     _show_splash_screen()
-    import time
 
-    time.sleep(1)  # Give user time to see splash screen
+    # Import and build the app while the splash is on screen (the session
+    # module pulls in Textual and the model clients, which is most of the
+    # startup time), then only wait out whatever splash time is left
+    from aihack.cli.session import SessionApp
+
     app = SessionApp()
+    remaining = SPLASH_SECONDS - (time.monotonic() - shown_at)
+    if remaining > 0:
+        time.sleep(remaining)
+    _install_uvloop()  # Textual's App.run() picks up the loop policy
     app.run()
@@ -1,31 +1,160 @@
 """Interactive session mode for AI-Hack."""
 import asyncio
-from typing import Any, Dict, List, Optional
+import functools
+import os
+import re
+import sys
+import time
+from bisect import bisect_left
+from collections import OrderedDict, deque
+from importlib import resources
+from itertools import accumulate
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal, VerticalScroll
 from textual.events import Click, Key
+from textual.widget import Widget
 from textual.widgets import Header, Input, Label, ListItem, ListView, Static
 
 from ..core.session_service import SessionService
-from ..core.utils.fs.file_completion import FileCompletionEngine, FileCompletionState
+from ..core.utils.fs.file_completion import (
+    MENTION_PATTERN,
+    FileCompletionEngine,
+    FileCompletionState,
+)
 from ..core.utils.fs.file_utils import get_file_suggestions
 from ..core.utils.fs.smart_completion import AdvancedFileCompletion
 
+# Read the stylesheet once at import rather than from disk per app instance
+_SESSION_CSS = resources.files("aihack.cli").joinpath("session.css").read_text("utf-8")
+
+# Input modes keyed by leading character:
+# (prompt icon, placeholder, status banner class, status banner text)
+_MODE_TABLE: Dict[str, Tuple[str, str, str, str]] = {
+    ">": (
+        "🔧",
+        "Shell command...",
+        "shell-mode",
+        "🔧 > Shell Commands - Execute system commands safely • ↑↓ navigate • Tab/Enter select • Esc cancel",
+    ),
+    "@": (
+        "📄",
+        "File mention...",
+        "file-mode",
+        "📄 @ File Reference - Include files/dirs in chat • ↑↓ navigate • Tab/Enter select • Esc cancel",
+    ),
+    "/": (
+        "⚡",
+        "Slash command...",
+        "command-mode",
+        "⚡ / Slash Commands - AI tasks & system commands • ↑↓ navigate • Tab/Enter select • Esc cancel",
+    ),
+    "#": (
+        "🧠",
+        "Memory command...",
+        "memory-mode",
+        "🧠 # Memory Mode - Save/load context, bridge AI models • ↑↓ navigate • Tab/Enter select",
+    ),
+}
+
+# Per-character streaming delay multipliers for ASCII, indexed by ord(char):
+# pause at punctuation, move faster through spaces
+_DELAY_MULT = [1.0] * 128
+for _char in ".,!?":
+    _DELAY_MULT[ord(_char)] = 3.0
+_DELAY_MULT[ord(" ")] = 0.5
+
+# Chat-mode prompt icon per model
+_MODEL_ICONS: Dict[str, str] = {"local": "🤖", "claude": "🧠", "gemini": "✨"}
+
+# Mention ending at the cursor, matched the same way parse_input finds them
+_MENTION_RE = re.compile(MENTION_PATTERN + "$")
+# Where a mention's token stops
+_MENTION_END_RE = re.compile(r"[\s@]")
+
+# Suggestion list rows as (text, is_header) pairs
+_Rows = Tuple[Tuple[str, bool], ...]
+
+
+@functools.lru_cache(maxsize=32)
+def _render_rows(header: str, icon: Optional[str], items: Tuple[str, ...]) -> _Rows:
+    """Render a header plus one row per item, memoized per suggestion list.
+
+    With no icon given, items get a directory or file icon from their path.
+    Suggestion sources change far less often than keystrokes arrive, so
+    typing within the same context reuses the rendered strings.
+    """
+    rows = [(header, True)]
+    for item in items:
+        item_icon = icon or ("📁" if item.endswith("/") else "📄")
+        rows.append((f"{item_icon} {item}", False))
+    return tuple(rows)
+
+
+def _cap_rows(
+    rows: Sequence[Tuple[str, bool]], limit: int
+) -> Sequence[Tuple[str, bool]]:
+    """Truncate rows after the limit-th non-header row."""
+    selectable = 0
+    for i, (_, is_header) in enumerate(rows):
+        if not is_header:
+            selectable += 1
+            if selectable == limit:
+                return rows[: i + 1]
+    return rows
+
+
+def _insert_file_mention(
+    text: str, cursor_pos: int, suggestion: str
+) -> Tuple[str, int]:
+    """Complete the @mention before the cursor, returning new text and cursor.
+
+    Only that mention's token is replaced; text after it is kept as typed.
+    """
+    at_pos = text.rfind("@", 0, cursor_pos)
+    if at_pos < 0:
+        return f"@{suggestion} ", len(suggestion) + 2
+    token_end = _MENTION_END_RE.search(text, at_pos + 1)
+    head = text[: at_pos + 1] + suggestion
+    rest = text[token_end.start() :] if token_end else ""
+    if suggestion.endswith("/"):
+        return head + rest, len(head)  # Keep completing inside the directory
+    if not rest[:1].isspace():
+        rest = " " + rest
+    return head + rest, len(head) + 1
+
 
 class StreamingText(Static):
     """A widget that displays text with streaming animation."""
 
+    FRAME_SECONDS = 1 / 60  # Reveal text at most once per frame
+
     def __init__(self, content: str, *args: Any, **kwargs: Any) -> None:
         super().__init__("", *args, **kwargs)
         self.full_content = content
-        self.current_content = ""
+        self.revealed = 0  # Number of characters of full_content shown so far
         self.streaming = False
-        self.scroll_container: Optional[Any] = None
-
-    def set_scroll_container(self, container: Any) -> None:
-        """Set the container to auto-scroll during streaming."""
-        self.scroll_container = container
+        # Reveal plan built once: _reveal_costs[i] is the cost, in units of the
+        # streaming speed, of showing content[: i + 1], pausing at punctuation
+        # and moving faster through spaces
+        self._reveal_costs = list(
+            accumulate(
+                _DELAY_MULT[code] if code < 128 else 1.0 for code in map(ord, content)
+            )
+        )
 
     async def start_streaming(self, speed: float = 0.02) -> None:
         """Start the streaming animation."""
@@ -33,63 +162,78 @@ class StreamingText(Static):
             return
 
         self.streaming = True
-        self.current_content = ""
-
-        for i, char in enumerate(self.full_content):
-            if not self.streaming:  # Allow interruption
-                break
+        self.revealed = 0
+        content = self.full_content
+        frame = self.FRAME_SECONDS
+        next_tick = time.monotonic()
 
-            self.current_content += char
-            self.update(self.current_content)
-
-            # Only auto-scroll if user is already at the bottom (not manually scrolled up)
-            if (
-                self.scroll_container is not None and i % 10 == 0
-            ):  # Every 10 chars to avoid too frequent scrolling
-                # Check if user is at or near the bottom before auto-scrolling
-                if self._is_user_at_bottom():
-                    self.scroll_container.scroll_end(animate=False)
-
-            # Vary speed based on character type for more natural feel
-            if char in ".,!?":
-                await asyncio.sleep(speed * 3)  # Pause at punctuation
-            elif char == " ":
-                await asyncio.sleep(speed * 0.5)  # Faster through spaces
-            else:
-                await asyncio.sleep(speed)
-
-        # Final scroll only if user was following along (at bottom)
-        if self.scroll_container is not None and self._is_user_at_bottom():
-            self.scroll_container.scroll_end(animate=False)
+        try:
+            for end in self._frame_ends(speed):
+                if not self.streaming:  # Allow interruption
+                    break
+
+                # Frames that land inside a pause reveal nothing new
+                if end != self.revealed:
+                    self.revealed = end
+                    self.update(content[:end])
+
+                # Sleep until the next frame boundary on the monotonic clock, so
+                # time spent rendering counts against the frame; when running
+                # behind, only yield and let the next frames catch up
+                next_tick += frame
+                await asyncio.sleep(max(0.0, next_tick - time.monotonic()))
+        except asyncio.CancelledError:
+            # Cancelled by a new submission or the user: show everything
+            self.stop_streaming()
+            raise
 
         self.streaming = False
 
-    def _is_user_at_bottom(self) -> bool:
-        """Check if the user is currently scrolled to the bottom (or close to it)."""
-        if not self.scroll_container:
-            return True
+    def _frame_ends(self, speed: float) -> Iterator[int]:
+        """Yield how much of the content is shown after each frame.
 
-        try:
-            # Consider "at bottom" if within 2 lines of the actual bottom
-            current_scroll = self.scroll_container.scroll_y
-            max_scroll = self.scroll_container.max_scroll_y
-            return bool(current_scroll >= max_scroll - 2)
-        except (AttributeError, TypeError):
-            # If we can't determine scroll position, assume at bottom
-            return True
+        Each frame adds FRAME_SECONDS of budget, and a character is shown once
+        the cost of everything before it fits in the budget spent so far; one
+        bisect per frame instead of a per-character loop.
+        """
+        costs = self._reveal_costs
+        total = len(costs)
+        step = self.FRAME_SECONDS / speed if speed > 0 else float("inf")
+        frames = 0
+        end = 0
+        while end < total:
+            frames += 1
+            # Costs are whole multiples of half a character, so a budget that
+            # only reaches one through rounding error is a tie: not yet due
+            budget = frames * step - 1e-9
+            end = min(total, bisect_left(costs, budget) + 1)
+            yield end
 
     def stop_streaming(self) -> None:
         """Stop streaming and show full content immediately."""
         self.streaming = False
-        self.current_content = self.full_content
-        self.update(self.current_content)
+        self.revealed = len(self.full_content)
+        self.update(self.full_content)
 
 
 class SessionApp(App):
     """An interactive TUI session for AI-Hack."""
 
-    CSS_PATH = "session.css"
+    CSS = _SESSION_CSS
     ENABLE_COMMAND_PALETTE = False  # Disable built-in command palette
+    EXIT_COMMANDS = frozenset({"/exit", "/quit", "/q"})
+    SUGGESTION_DEBOUNCE_SECONDS = 0.06  # Coalesce suggestion work while typing
+    SUGGESTION_KEYS = frozenset({"up", "down", "tab", "enter"})
+    MENTION_SCAN_CHARS = 256  # Longest file mention looked for before the cursor
+    COMPLETION_LIMIT = 8  # Enhanced file suggestions fetched per query
+    COMPLETION_CACHE_SIZE = 64
+    COMPLETION_CACHE_TTL = 5.0  # Seconds before cached file suggestions go stale
+    MAX_VISIBLE_SUGGESTIONS = 30  # Suggestion rows mounted at once
+    STREAMING_MIN_CHARS = 120  # Shorter responses skip the streaming animation
+    MAX_LOG_MESSAGES = 500  # Bound the widget tree so re-layout cost stays flat
+    SHUTDOWN_TIMEOUT_SECONDS = 0.5  # Wait for cancelled tasks on quit
+    # Model cycle order for Ctrl+M
+    NEXT_MODEL = {"local": "claude", "claude": "gemini", "gemini": "local"}
 
     BINDINGS = [
         ("ctrl+c", "cancel_or_quit", "Cancel/Quit"),
@@ -107,21 +251,47 @@ class SessionApp(App):
             ""  # Track what type of suggestions we're showing
         )
         self.selected_suggestion_index = 0  # Track which suggestion is selected
+        # Rendered suggestion rows and their (ListItem, Label) widgets, so
+        # the list can be diffed and updated in place
+        self._suggestion_rows: _Rows = ()
+        self._suggestion_items: List[Tuple[ListItem, Label]] = []
+        self._selectable_items: List[ListItem] = []  # Non-header rows, in order
+        self._highlighted_item: Optional[ListItem] = None
+        self._highlight_pending = False  # Highlight move queued for next refresh
         self.detail_mode = False  # False = summary, True = full content
         self.last_cancel_time = (
             0.0  # Track time of last cancel for double-tap detection
         )
         self.scroll_momentum = 0.0  # Track scroll momentum for graduated scrolling
         self.last_scroll_time = 0.0
-        self.command_history: List[str] = []  # Track command history
+        self.command_history: Deque[str] = deque(maxlen=50)  # Last 50 commands
+        self._history_set: Set[str] = set()  # Mirrors command_history for lookups
         self.history_index = -1  # Current position in history (-1 = not browsing)
         self.current_streaming_widget: Optional[
             StreamingText
         ] = None  # Track active streaming for interruption
         self.is_processing = False  # Track if we're processing a command
+        self._user_message_count = 0  # Session totals for the exit summary
+        self._ai_response_count = 0
         self.current_task: Optional[
             asyncio.Task[str]
         ] = None  # Track current AI task for cancellation
+        self._suggestion_task: Optional[
+            asyncio.Task[None]
+        ] = None  # Pending debounced suggestion refresh
+        self._streaming_task: Optional[
+            asyncio.Task[None]
+        ] = None  # Running StreamingText animation
+        self._last_input_value: Optional[str] = None  # Last value handled
+        self._quit_hint_task: Optional[
+            asyncio.Task[None]
+        ] = None  # Pending auto-hide of the quit hint
+        self._input_mode: Optional[str] = None  # Mode the indicators last showed
+        # Styling for the active model, refreshed by _sync_model_cache
+        self._current_model = ""
+        self._current_model_css = ""
+        self._current_model_icon = ">"
+        self._current_model_placeholder = ""
 
         # Enhanced file completion
         self.completion_engine = FileCompletionEngine()
@@ -131,9 +301,27 @@ class SessionApp(App):
 
         # Performance optimizations
         self._last_completion_text = ""
-        self._completion_cache: Dict[str, List] = {}
+        self._completion_cache: "OrderedDict[Tuple[str, str, int], Tuple[float, List]]" = (
+            OrderedDict()
+        )
         self._last_completion_time = 0.0
 
+        # Suggestion handlers keyed by the input's leading character
+        self._prefix_handlers: Dict[str, Callable[[str, int], Awaitable[None]]] = {
+            "/": self._show_slash_suggestions,
+            "@": self._show_mention_suggestions,
+            ">": self._show_bash_suggestions,
+            "#": self._show_memory_suggestions,  # Memory/context (future feature)
+        }
+        # Completion appliers keyed by suggestion type
+        self._suggestion_appliers: Dict[str, Callable[[Input, str, str], None]] = {
+            "slash": self._apply_slash_suggestion,
+            "files": self._apply_file_suggestion,
+            "enhanced_files": self._apply_file_suggestion,
+            "bash": self._apply_bash_suggestion,
+            "memory": self._apply_memory_suggestion,
+        }
+
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
         yield Header()
@@ -148,15 +336,29 @@ class SessionApp(App):
 
     async def on_mount(self) -> None:
         """Called when the app is first mounted."""
-        self.query_one(Input).focus()
+        # Cache widget lookups once; the layout never replaces these widgets
+        self._content_log = self.query_one("#content-log", VerticalScroll)
+        self._command_input = self.query_one("#command-input", Input)
+        self._prompt_icon = self.query_one("#prompt-icon", Static)
+        self._status_banner = self.query_one("#status-banner", Static)
+        self._suggestions_list = self.query_one("#suggestions-list", ListView)
+        self._quit_hint = self.query_one("#quit-hint", Static)
+        # Keep the log pinned to its newest message as content grows. Textual
+        # releases the anchor when the user scrolls away and restores it once
+        # they scroll back to the bottom, so nothing needs to poll scroll state
+        self._content_log.anchor()
+        # Keystroke handlers timestamp with the loop clock; look the loop up once
+        self._event_loop = asyncio.get_running_loop()
+
+        self._command_input.focus()
 
         # Initialize AI service
         status = await self.service.initialize()
-        log = self.query_one("#content-log")
-
-        log.mount(Static(status["message"], classes="system-message"))
+        self._sync_model_cache()
+        messages = [status["message"]]
         if not status["available"] and "suggestion" in status:
-            log.mount(Static(status["suggestion"], classes="system-message"))
+            messages.append(status["suggestion"])
+        self._log_system_messages(*messages)
 
         # Initialize enhanced file completion
         try:
@@ -164,41 +366,40 @@ class SessionApp(App):
             await self.advanced_completion.initialize()
             self.completion_initialized = True
         except Exception as e:
-            log.mount(
-                Static(
-                    f"⚠️ File completion init warning: {str(e)}",
-                    classes="system-message",
-                )
-            )
+            self._log_system_messages(f"⚠️ File completion init warning: {str(e)}")
 
     async def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle user command input."""
         command = event.value.strip()
-        log = self.query_one("#content-log")
-        input_widget = self.query_one(Input)
+        log = self._content_log
+        input_widget = self._command_input
 
         if not command:
             return
 
-        if command.lower() in ("/exit", "/quit", "/q"):
+        if command[:1] == "/" and command.lower() in self.EXIT_COMMANDS:
+            await self._cancel_pending_tasks()
             self.exit()
             return
 
-        # Add to command history
-        if command not in self.command_history:
+        # A new message finishes any response still being streamed
+        self._cancel_streaming()
+
+        # Add to command history (bounded deque; the set gives O(1) dedup)
+        if command not in self._history_set:
+            if len(self.command_history) == self.command_history.maxlen:
+                self._history_set.discard(self.command_history[0])
             self.command_history.append(command)
-            # Keep last 50 commands
-            self.command_history = self.command_history[-50:]
+            self._history_set.add(command)
         self.history_index = -1  # Reset history browsing
 
-        # Echo the command to the log
-        log.mount(Static(f"> {command}", classes="user-message"))
         input_widget.clear()
+        self._last_input_value = None  # Never skip the next keystroke
 
-        # Show loading indicator
+        # Echo the command and show the loading indicator in a single mount
         loading_message = Static("🤖 Thinking...", classes="loading-message")
-        log.mount(loading_message)
-        log.scroll_end()
+        log.mount_all([Static(f"> {command}", classes="user-message"), loading_message])
+        self._user_message_count += 1
 
         # Ensure input stays focused and mark as processing
         input_widget.focus()
@@ -215,149 +416,198 @@ class SessionApp(App):
             self.current_task = asyncio.create_task(task_coroutine)
             response = await self.current_task
 
-            # Remove loading message
-            loading_message.remove()
-
             # Handle special responses
             if response == "/exit":
+                await self._cancel_pending_tasks()
                 self.exit()
                 return
             elif response == "/clear":
                 # Clear all messages except welcome
+                loading_message.remove()
                 for widget in log.children[1:]:  # Keep welcome message
                     widget.remove()
                 return
 
-            # Show streaming response for AI-generated content
+            # Commands can switch models; pick up the model-specific CSS class
+            self._sync_model_cache()
+            css_class = self._current_model_css
+
+            # Stream AI-generated content; short replies are shown at once
+            # since animating a few words is only overhead
             if (
-                response.strip()
+                len(response) >= self.STREAMING_MIN_CHARS
+                and response.strip()
                 and not response.startswith("❌")
                 and not response.startswith("✅")
             ):
-                # Get model-specific CSS class
-                model_name = self.service.get_current_model_name()
-                css_class = f"ai-response-{model_name}"
-
                 # Create streaming text widget for AI responses
                 streaming_widget = StreamingText(response, classes=css_class)
-                streaming_widget.set_scroll_container(
-                    log
-                )  # Enable auto-scroll during streaming
                 self.current_streaming_widget = (
                     streaming_widget  # Track for interruption
                 )
-                log.mount(streaming_widget)
+                self._replace_message(loading_message, streaming_widget)
                 # Start streaming animation
-                asyncio.create_task(streaming_widget.start_streaming(speed=0.015))
+                self._streaming_task = asyncio.create_task(
+                    streaming_widget.start_streaming(speed=0.015)
+                )
             else:
-                # Show non-AI responses immediately (errors, confirmations, etc.)
-                model_name = self.service.get_current_model_name()
-                css_class = f"ai-response-{model_name}"
-                log.mount(Static(response, classes=css_class))
+                # Show short and non-AI responses immediately (errors,
+                # confirmations, etc.)
+                self._replace_message(
+                    loading_message, Static(response, classes=css_class)
+                )
+            self._ai_response_count += 1
 
         except asyncio.CancelledError:
             loading_message.remove()
             # Don't add error message for cancelled tasks - user intentionally cancelled
         except Exception as e:
-            loading_message.remove()
-            log.mount(Static(f"❌ Error: {str(e)}", classes="error-message"))
+            self._replace_message(
+                loading_message, Static(f"❌ Error: {str(e)}", classes="error-message")
+            )
         finally:
             # Clear processing state
             self.is_processing = False
             self.current_streaming_widget = None
             self.current_task = None
 
-        log.scroll_end()
+        self._trim_log(log)
+
+    def _log_system_messages(self, *messages: str) -> None:
+        """Append system messages to the log in one mount, keeping it bounded."""
+        log = self._content_log
+        log.mount_all([Static(text, classes="system-message") for text in messages])
+        self._trim_log(log)
+
+    def _replace_message(self, old: Widget, new: Widget) -> None:
+        """Swap a log message for another at the same position in one step."""
+        self._content_log.mount(new, after=old)
+        old.remove()
+
+    def _cancel_streaming(self) -> bool:
+        """Cancel the streaming animation if one is running."""
+        task = self._streaming_task
+        self._streaming_task = None
+        if task is None or task.done():
+            return False
+        task.cancel()
+        return True
+
+    def _trim_log(self, log: Any) -> None:
+        """Drop the oldest messages so the log holds at most MAX_LOG_MESSAGES."""
+        excess = len(log.children) - self.MAX_LOG_MESSAGES
+        if excess > 0:
+            # Keep the welcome message at index 0
+            log.remove_children(log.children[1 : excess + 1])
 
     async def on_input_changed(self, event: Input.Changed) -> None:
         """Handle input changes to update visual indicators and show suggestions."""
-        prompt_icon = self.query_one("#prompt-icon", Static)
+        prompt_icon = self._prompt_icon
         current_value = event.value
-        input_widget = self.query_one("#command-input", Input)
-        status_banner = self.query_one("#status-banner", Static)
+        input_widget = self._command_input
+        status_banner = self._status_banner
+
+        # Focus changes and programmatic assignments can re-send the same value
+        if current_value == self._last_input_value:
+            return
+        self._last_input_value = current_value
+
+        # Reset history browsing when user starts typing; a cursor at the end
+        # means the change came from typing, not history navigation
+        at_end = event.input.cursor_position == len(current_value)
+        if self.history_index != -1 and at_end:
+            self.history_index = -1
+
+        # Suggestions are debounced; the mode indicators below update immediately
+        cursor_pos = input_widget.cursor_position
+        self._schedule_suggestions(current_value, cursor_pos)
+
+        # Only restyle when the input mode actually changes; most keystrokes
+        # stay within the same mode and need no indicator work at all
+        mode_key = current_value[:1]
+        mode = _MODE_TABLE.get(mode_key)
+        if mode is None:
+            # Chat mode indicators depend on the active model
+            mode_key = self._current_model
+        if mode_key == self._input_mode:
+            return
+        self._input_mode = mode_key
+
+        if mode is not None:
+            # Shell / file mention / slash command / memory mode
+            icon, placeholder, mode_class, banner_text = mode
+            prompt_icon.update(icon)
+            input_widget.placeholder = placeholder
+            status_banner.update(banner_text)
+            # Swap the whole class set at once: one restyle per mode change
+            status_banner.set_classes(mode_class)
+        else:
+            # Regular chat mode - show current model
+            prompt_icon.update(self._current_model_icon)
+            input_widget.placeholder = self._current_model_placeholder
+            status_banner.set_classes("hidden")
+
+    def _sync_model_cache(self) -> None:
+        """Refresh the cached styling for the active model when it changes."""
+        model_name = self.service.get_current_model_name()
+        if model_name == self._current_model:
+            return
+        self._current_model = model_name
+        self._current_model_css = f"ai-response-{model_name}"
+        self._current_model_icon = _MODEL_ICONS.get(model_name, ">")
+        self._current_model_placeholder = f"Chat with {model_name.title()}..."
+
+    def _schedule_suggestions(self, current_value: str, cursor_pos: int) -> None:
+        """Restart the debounce timer so only the last keystroke in a burst queries."""
+        if self._suggestion_task is not None:
+            self._suggestion_task.cancel()
+        self._suggestion_task = asyncio.create_task(
+            self._debounced_suggestions(current_value, cursor_pos)
+        )
 
-        # Reset history browsing when user starts typing
-        if self.history_index != -1 and hasattr(event, "input"):
-            # Check if this change was from user typing (not from history navigation)
-            if event.input and event.input.cursor_position == len(current_value):
-                self.history_index = -1
+    async def _flush_suggestions(self) -> None:
+        """Run a pending debounced refresh now, so keys act on current input."""
+        task = self._suggestion_task
+        if task is None or task.done():
+            return
+        task.cancel()
+        self._suggestion_task = None
+        input_widget = self._command_input
+        await self._update_suggestions(input_widget.value, input_widget.cursor_position)
 
-        # Handle different types of suggestions - check for @ anywhere in input first
-        cursor_pos = getattr(input_widget, "cursor_position", len(current_value))
+    async def _debounced_suggestions(self, current_value: str, cursor_pos: int) -> None:
+        """Wait out the debounce window, then refresh suggestions."""
+        try:
+            await asyncio.sleep(self.SUGGESTION_DEBOUNCE_SECONDS)
+            await self._update_suggestions(current_value, cursor_pos)
+        except asyncio.CancelledError:
+            # Superseded by a newer keystroke
+            pass
 
+    async def _update_suggestions(self, current_value: str, cursor_pos: int) -> None:
+        """Show the suggestions matching the input's prefix."""
         # Enhanced @ detection - check anywhere in input
         if "@" in current_value and self.completion_initialized:
             await self._handle_enhanced_file_completion(current_value, cursor_pos)
-        elif current_value.startswith("/"):
-            # Slash command suggestions
-            command_part = current_value[1:]  # Remove the /
-            await self._show_slash_suggestions(command_part)
-        elif current_value.startswith("@"):
-            # Fallback to basic file mention suggestions for backward compatibility
-            if len(current_value) > 1:
-                await self._show_file_suggestions(current_value)
-            else:
-                # Show recent files when just @ is typed
-                await self._show_recent_files_suggestions()
-        elif current_value.startswith(">"):
-            # Bash command suggestions
-            command_part = current_value[1:].strip()
-            await self._show_bash_suggestions(command_part)
-        elif current_value.startswith("#"):
-            # Memory/context suggestions (future feature)
-            await self._show_memory_suggestions()
-        else:
+            return
+
+        handler = self._prefix_handlers.get(current_value[:1])
+        if handler is not None:
+            await handler(current_value, cursor_pos)
+        elif self.suggestions_visible:
             # Hide suggestions for regular chat
-            if self.suggestions_visible:
-                await self._hide_suggestions()
+            await self._hide_suggestions()
 
-        if current_value.startswith(">"):
-            # Shell command mode
-            prompt_icon.update("🔧")
-            input_widget.placeholder = "Shell command..."
-            status_banner.update(
-                "🔧 > Shell Commands - Execute system commands safely • ↑↓ navigate • Tab/Enter select • Esc cancel"
-            )
-            status_banner.set_class(False, "hidden")
-            status_banner.set_class(True, "shell-mode")
-        elif current_value.startswith("@"):
-            # File mention mode
-            prompt_icon.update("📄")
-            input_widget.placeholder = "File mention..."
-            status_banner.update(
-                "📄 @ File Reference - Include files/dirs in chat • ↑↓ navigate • Tab/Enter select • Esc cancel"
-            )
-            status_banner.set_class(False, "hidden")
-            status_banner.set_class(True, "file-mode")
-        elif current_value.startswith("/"):
-            # Slash command mode
-            prompt_icon.update("⚡")
-            input_widget.placeholder = "Slash command..."
-            status_banner.update(
-                "⚡ / Slash Commands - AI tasks & system commands • ↑↓ navigate • Tab/Enter select • Esc cancel"
-            )
-            status_banner.set_class(False, "hidden")
-            status_banner.set_class(True, "command-mode")
-        elif current_value.startswith("#"):
-            # Memory/context mode (future feature)
-            prompt_icon.update("🧠")
-            input_widget.placeholder = "Memory command..."
-            status_banner.update(
-                "🧠 # Memory Mode - Save/load context, bridge AI models • ↑↓ navigate • Tab/Enter select"
-            )
-            status_banner.set_class(False, "hidden")
-            status_banner.set_class(True, "memory-mode")
+    async def _show_mention_suggestions(
+        self, current_value: str, cursor_pos: int
+    ) -> None:
+        """Show basic file suggestions for input starting with @."""
+        # Fallback to basic file mention suggestions for backward compatibility
+        if len(current_value) > 1:
+            await self._show_file_suggestions(current_value, cursor_pos)
         else:
-            # Regular chat mode - show current model
-            model_name = self.service.get_current_model_name()
-            model_icons = {"local": "🤖", "claude": "🧠", "gemini": "✨"}
-            prompt_icon.update(model_icons.get(model_name, ">"))
-            input_widget.placeholder = f"Chat with {model_name.title()}..."
-            status_banner.set_class(True, "hidden")
-            status_banner.set_class(False, "shell-mode")
-            status_banner.set_class(False, "file-mode")
-            status_banner.set_class(False, "command-mode")
-            status_banner.set_class(False, "memory-mode")
+            # Show recent files when just @ is typed
+            await self._show_recent_files_suggestions()
 
     async def _handle_enhanced_file_completion(
         self, current_value: str, cursor_pos: int
@@ -365,7 +615,7 @@ class SessionApp(App):
         """Handle enhanced file completion with mid-prompt @ detection."""
         try:
             # Performance optimization: avoid repeated processing
-            current_time = asyncio.get_event_loop().time()
+            current_time = self._event_loop.time()
             if (
                 current_value == self._last_completion_text
                 and current_time - self._last_completion_time < 0.1
@@ -375,6 +625,17 @@ class SessionApp(App):
             self._last_completion_text = current_value
             self._last_completion_time = current_time
 
+            # Only a mention touching the cursor can be active, so skip the
+            # full parse when the text before the cursor doesn't end in one
+            if not (
+                _MENTION_RE.search(current_value, 0, cursor_pos)
+                or current_value.startswith("@", cursor_pos)
+            ):
+                self.completion_state = None
+                if self.suggestions_visible:
+                    await self._hide_suggestions()
+                return
+
             # Parse input for file mentions
             self.completion_state = self.completion_engine.parse_input(
                 current_value, cursor_pos
@@ -384,21 +645,26 @@ class SessionApp(App):
             if self.completion_state.active_mention:
                 mention = self.completion_state.active_mention
 
-                # Check cache first
-                cache_key = f"{mention.file_ref}:{mention.completion_type.value}"
-                if cache_key in self._completion_cache:
-                    suggestions = self._completion_cache[cache_key]
+                # Check cache first (LRU, entries expire after the TTL). The
+                # completion type is derived from file_ref, so it isn't keyed
+                limit = self.COMPLETION_LIMIT
+                cache_key = (os.getcwd(), mention.file_ref, limit)
+                cached = self._completion_cache.get(cache_key)
+                if (
+                    cached is not None
+                    and current_time - cached[0] < self.COMPLETION_CACHE_TTL
+                ):
+                    self._completion_cache.move_to_end(cache_key)
+                    suggestions = cached[1]
                 else:
                     # Get suggestions using advanced completion
                     suggestions = await self.advanced_completion.get_smart_suggestions(
-                        mention.file_ref, limit=8
+                        mention.file_ref, limit=limit
                     )
-                    # Cache for 5 seconds
-                    self._completion_cache[cache_key] = suggestions
-                    # Simple cache cleanup - keep only last 20 entries
-                    if len(self._completion_cache) > 20:
-                        oldest_key = next(iter(self._completion_cache))
-                        del self._completion_cache[oldest_key]
+                    self._completion_cache[cache_key] = (current_time, suggestions)
+                    self._completion_cache.move_to_end(cache_key)
+                    if len(self._completion_cache) > self.COMPLETION_CACHE_SIZE:
+                        self._completion_cache.popitem(last=False)
 
                 if suggestions:
                     # Update completion context
@@ -410,7 +676,7 @@ class SessionApp(App):
                     await self._show_enhanced_file_suggestions(suggestions, mention)
                 else:
                     # Fallback to basic suggestions
-                    await self._show_file_suggestions(current_value)
+                    await self._show_file_suggestions(current_value, cursor_pos)
             else:
                 # No active mention, hide suggestions
                 if self.suggestions_visible:
@@ -419,60 +685,84 @@ class SessionApp(App):
         except Exception:
             # Fallback to basic file suggestions on any error
             if current_value.startswith("@"):
-                await self._show_file_suggestions(current_value)
+                await self._show_file_suggestions(current_value, cursor_pos)
 
-    async def _show_enhanced_file_suggestions(
-        self, suggestions: List[Dict[str, Any]], mention: Any
-    ) -> None:
-        """Show enhanced file suggestions with smart formatting."""
-        if not suggestions:
-            return
+    def _render_suggestion_rows(self, rows: Sequence[Tuple[str, bool]]) -> None:
+        """Update the suggestions list in place to show (text, is_header) rows.
 
-        suggestions_list = self.query_one("#suggestions-list", ListView)
-        suggestions_list.clear()
+        Rows that are unchanged since the last render are left alone; only
+        differing labels are updated and the tail is appended or removed.
+        """
+        rows = tuple(rows)
+        if rows == self._suggestion_rows:
+            return
 
-        # Add category header
-        suggestions_list.append(
-            ListItem(Label("─── Smart File Suggestions ───"), classes="category-header")
-        )
+        items = self._suggestion_items
+        shared = min(len(rows), len(items))
+        for i in range(shared):
+            if rows[i] != self._suggestion_rows[i]:
+                text, is_header = rows[i]
+                item, label = items[i]
+                label.update(text)
+                item.set_class(is_header, "category-header")
+
+        if len(rows) > shared:
+            new_items = []
+            for text, is_header in rows[shared:]:
+                label = Label(text)
+                item = ListItem(label, classes="category-header" if is_header else "")
+                new_items.append((item, label))
+            self._suggestions_list.extend(item for item, _ in new_items)
+            items.extend(new_items)
+        else:
+            for item, _ in items[shared:]:
+                item.remove()
+            del items[shared:]
 
-        # Add suggestions with enhanced formatting
-        display_suggestions = []
-        for suggestion in suggestions:
-            path = suggestion["path"]
-            icon = suggestion["icon"]
-            suggestion_type = suggestion.get("suggestion_type", "match")
-
-            # Create display text with context
-            if suggestion_type == "directory_mapped":
-                display_text = f"{icon} {path}"
-            elif suggestion_type == "exact_match":
-                display_text = f"{icon} {path}"
-            else:
-                display_text = f"{icon} {path}"
+        self._suggestion_rows = rows
+        self._selectable_items = [
+            item for (item, _), (_, is_header) in zip(items, rows) if not is_header
+        ]
 
-            suggestions_list.append(ListItem(Label(display_text)))
-            display_suggestions.append(path)
+    async def _present_suggestions(
+        self,
+        rows: Sequence[Tuple[str, bool]],
+        suggestions: List[str],
+        suggestion_type: str,
+    ) -> None:
+        """Render suggestion rows and make them the active, visible selection."""
+        self._render_suggestion_rows(_cap_rows(rows, self.MAX_VISIBLE_SUGGESTIONS))
 
-        # Update state
-        self.current_suggestions = display_suggestions
-        self.current_suggestion_type = "enhanced_files"
+        # Update state; only rendered rows are selectable, so keep just those
+        self.current_suggestions = suggestions[: len(self._selectable_items)]
+        self.current_suggestion_type = suggestion_type
         self.selected_suggestion_index = 0
 
         # Show suggestions
-        suggestions_list.set_class(False, "hidden")
+        self._suggestions_list.set_class(False, "hidden")
         self.suggestions_visible = True
         await self._update_suggestion_highlight()
 
-    async def _show_file_suggestions(self, current_value: str) -> None:
+    async def _show_enhanced_file_suggestions(
+        self, suggestions: List[Dict[str, Any]], mention: Any
+    ) -> None:
+        """Show enhanced file suggestions with smart formatting."""
+        if not suggestions:
+            return
+
+        rows = [("─── Smart File Suggestions ───", True)]
+        rows.extend((f"{s['icon']} {s['path']}", False) for s in suggestions)
+        await self._present_suggestions(
+            rows, [s["path"] for s in suggestions], "enhanced_files"
+        )
+
+    async def _show_file_suggestions(self, current_value: str, cursor_pos: int) -> None:
         """Show basic file suggestions (fallback method)."""
-        # Extract the partial file reference after @
-        parts = current_value.split("@")
-        if len(parts) > 1:  # Make sure there's at least one @ character
+        # Extract the partial file reference after the @ being typed
+        if "@" in current_value:  # Make sure there's at least one @ character
             try:
-                file_ref = (
-                    parts[-1].split()[0] if parts[-1] else ""
-                )  # Get the file reference part
+                match = _MENTION_RE.search(current_value, 0, cursor_pos)
+                file_ref = match.group(1) if match else ""
                 # Show suggestions immediately, even for empty string
                 if file_ref:
                     # Get filtered suggestions based on what's typed
@@ -482,73 +772,37 @@ class SessionApp(App):
                     suggestions = self.service.get_recent_files_suggestions()
 
                 if suggestions:
-                    suggestions_list = self.query_one("#suggestions-list", ListView)
-                    suggestions_list.clear()
-
                     # Add header to distinguish from enhanced suggestions
-                    suggestions_list.append(
-                        ListItem(
-                            Label("─── File Suggestions ───"), classes="category-header"
-                        )
-                    )
-
-                    for suggestion in suggestions[:8]:  # Limit to 8 suggestions
-                        icon = "📁" if suggestion.endswith("/") else "📄"
-                        suggestions_list.append(ListItem(Label(f"{icon} {suggestion}")))
-
-                    self.current_suggestions = suggestions
-                    self.current_suggestion_type = "files"
-                    self.selected_suggestion_index = 0
-                    suggestions_list.set_class(False, "hidden")
-                    self.suggestions_visible = True
-                    await self._update_suggestion_highlight()
+                    rows = _render_rows(
+                        "─── File Suggestions ───", None, tuple(suggestions[:8])
+                    )  # Limit to 8 suggestions
+                    await self._present_suggestions(rows, suggestions, "files")
             except (IndexError, AttributeError):
                 # Ignore errors when parsing incomplete input
                 pass
 
-    async def _show_slash_suggestions(self, partial_command: str) -> None:
+    async def _show_slash_suggestions(
+        self, current_value: str, cursor_pos: int
+    ) -> None:
         """Show slash command suggestions."""
+        partial_command = current_value[1:]  # Remove the /
         suggestions = self.service.get_slash_command_suggestions(partial_command)
 
         if suggestions:
-            suggestions_list = self.query_one("#suggestions-list", ListView)
-            suggestions_list.clear()
-
+            rows: List[Tuple[str, bool]] = []
             current_category = None
             for suggestion in suggestions[:10]:  # Limit to 10
                 # Add category header if it changed
                 if suggestion["category"] != current_category:
                     current_category = suggestion["category"]
-                    if suggestions_list.children:  # Only add separator if not first
-                        suggestions_list.append(
-                            ListItem(
-                                Label(f"─── {current_category} ───"),
-                                classes="category-header",
-                            )
-                        )
-                    else:
-                        suggestions_list.append(
-                            ListItem(
-                                Label(f"─── {current_category} ───"),
-                                classes="category-header",
-                            )
-                        )
+                    rows.append((f"─── {current_category} ───", True))
 
                 # Add command suggestion
-                suggestions_list.append(
-                    ListItem(
-                        Label(
-                            f"⚡ /{suggestion['command']} - {suggestion['description']}"
-                        )
-                    )
-                )
+                rows.append((suggestion["display"], False))
 
-            self.current_suggestions = [s["command"] for s in suggestions]
-            self.current_suggestion_type = "slash"
-            self.selected_suggestion_index = 0
-            suggestions_list.set_class(False, "hidden")
-            self.suggestions_visible = True
-            await self._update_suggestion_highlight()
+            await self._present_suggestions(
+                rows, [s["command"] for s in suggestions], "slash"
+            )
 
     async def _show_recent_files_suggestions(self) -> None:
         """Show recent files when @ is typed."""
@@ -556,62 +810,26 @@ class SessionApp(App):
         suggestions = self.service.get_recent_files_suggestions()
 
         if suggestions:
-            suggestions_list = self.query_one("#suggestions-list", ListView)
-            suggestions_list.clear()
+            rows = _render_rows("─── Files & Directories ───", None, tuple(suggestions))
+            await self._present_suggestions(rows, suggestions, "files")
 
-            suggestions_list.append(
-                ListItem(
-                    Label("─── Files & Directories ───"), classes="category-header"
-                )
-            )
-            for suggestion in suggestions:
-                icon = "📁" if suggestion.endswith("/") else "📄"
-                suggestions_list.append(ListItem(Label(f"{icon} {suggestion}")))
-
-            self.current_suggestions = suggestions
-            self.current_suggestion_type = "files"
-            self.selected_suggestion_index = 0
-            suggestions_list.set_class(False, "hidden")
-            self.suggestions_visible = True
-            await self._update_suggestion_highlight()
-
-    async def _show_bash_suggestions(self, partial_command: str) -> None:
+    async def _show_bash_suggestions(self, current_value: str, cursor_pos: int) -> None:
         """Show bash command suggestions."""
         # Get conversation context from recent messages
-        context = partial_command
+        context = current_value[1:].strip()  # Remove the >
 
         bash_suggestions = self.service.get_contextual_bash_suggestions(context)
 
         if bash_suggestions:
-            suggestions_list = self.query_one("#suggestions-list", ListView)
-            suggestions_list.clear()
-
-            suggestions_list.append(
-                ListItem(
-                    Label("─── Contextual Bash Commands ───"), classes="category-header"
-                )
+            rows = _render_rows(
+                "─── Contextual Bash Commands ───", "🔧", tuple(bash_suggestions)
             )
-            for cmd in bash_suggestions:
-                suggestions_list.append(ListItem(Label(f"🔧 {cmd}")))
-
-            self.current_suggestions = bash_suggestions
-            self.current_suggestion_type = "bash"
-            self.selected_suggestion_index = 0
-            suggestions_list.set_class(False, "hidden")
-            self.suggestions_visible = True
-            await self._update_suggestion_highlight()
+            await self._present_suggestions(rows, bash_suggestions, "bash")
 
-    async def _show_memory_suggestions(self) -> None:
+    async def _show_memory_suggestions(
+        self, current_value: str, cursor_pos: int
+    ) -> None:
         """Show memory/context suggestions (future feature)."""
-        suggestions_list = self.query_one("#suggestions-list", ListView)
-        suggestions_list.clear()
-
-        suggestions_list.append(
-            ListItem(
-                Label("─── Memory Commands (Coming Soon) ───"),
-                classes="category-header",
-            )
-        )
         future_commands = [
             "save context",
             "load context",
@@ -619,48 +837,51 @@ class SessionApp(App):
             "bridge gemini",
             "list contexts",
         ]
-        for cmd in future_commands:
-            suggestions_list.append(ListItem(Label(f"🧠 {cmd}")))
-
-        self.current_suggestions = future_commands
-        self.current_suggestion_type = "memory"
-        self.selected_suggestion_index = 0
-        suggestions_list.set_class(False, "hidden")
-        self.suggestions_visible = True
-        await self._update_suggestion_highlight()
+        rows = _render_rows(
+            "─── Memory Commands (Coming Soon) ───", "🧠", tuple(future_commands)
+        )
+        await self._present_suggestions(rows, future_commands, "memory")
 
     async def _update_suggestion_highlight(self) -> None:
         """Update the visual highlight on the selected suggestion."""
-        suggestions_list = self.query_one("#suggestions-list", ListView)
-
-        # Clear previous highlights
-        for i, item in enumerate(suggestions_list.children):
-            if hasattr(item, "set_class"):
-                item.set_class(False, "selected")
-
-        # Highlight selected item (skip category headers)
-        visible_items = [
-            item
-            for item in suggestions_list.children
-            if not hasattr(item, "classes")
-            or "category-header" not in str(item.classes)
-        ]
-        if visible_items and 0 <= self.selected_suggestion_index < len(visible_items):
-            selected_item = visible_items[self.selected_suggestion_index]
+        suggestions_list = self._suggestions_list
+
+        # Clear the previous highlight
+        if self._highlighted_item is not None:
+            self._highlighted_item.set_class(False, "selected")
+            self._highlighted_item = None
+
+        # Highlight selected item (category headers are never selectable)
+        selectable = self._selectable_items
+        if 0 <= self.selected_suggestion_index < len(selectable):
+            selected_item = selectable[self.selected_suggestion_index]
             selected_item.set_class(True, "selected")
+            self._highlighted_item = selected_item
 
             # Scroll to show the selected item
             try:
                 suggestions_list.scroll_to_widget(selected_item, animate=False)
             except (ValueError, AttributeError):
                 # Fallback: scroll to center if scroll_to_widget fails
-                total_items = len(suggestions_list.children)
+                total_items = len(self._suggestion_items)
                 if total_items > 0:
                     scroll_position = (
                         self.selected_suggestion_index / total_items
                     ) * suggestions_list.max_scroll_y
                     suggestions_list.scroll_y = scroll_position
 
+    def _schedule_highlight(self) -> None:
+        """Move the highlight after the next refresh, once per burst of key repeats."""
+        if not self._highlight_pending:
+            self._highlight_pending = True
+            self.call_after_refresh(self._flush_highlight)
+
+    async def _flush_highlight(self) -> None:
+        """Apply the highlight for the latest selected suggestion."""
+        self._highlight_pending = False
+        if self.suggestions_visible:
+            await self._update_suggestion_highlight()
+
     async def _handle_tab_completion(self) -> None:
         """Handle tab completion by completing with the selected suggestion."""
         await self._complete_with_selected_suggestion()
@@ -696,7 +917,7 @@ class SessionApp(App):
 
                 if expanded and self.completion_state:
                     # Apply expansion
-                    input_widget = self.query_one("#command-input", Input)
+                    input_widget = self._command_input
                     new_text = self.completion_engine.apply_completion(
                         self.completion_state, context, expanded
                     )
@@ -720,15 +941,19 @@ class SessionApp(App):
     async def _maybe_continue_suggestions(self) -> None:
         """Continue showing suggestions if appropriate for further expansion."""
         try:
-            input_widget = self.query_one("#command-input", Input)
+            input_widget = self._command_input
             current_value = input_widget.value
-            cursor_pos = getattr(input_widget, "cursor_position", len(current_value))
+            cursor_pos = input_widget.cursor_position
 
-            # Re-parse input to see if we should continue
-            if "@" in current_value and self.completion_initialized:
-                # Small delay to let input settle
-                await asyncio.sleep(0.01)
-                await self._handle_enhanced_file_completion(current_value, cursor_pos)
+            # Re-parse input to see if we should continue; go through the
+            # suggestion debounce so a burst of completions queries only once.
+            # An active mention ends at the cursor, so only look just before it
+            window_start = max(0, cursor_pos - self.MENTION_SCAN_CHARS)
+            if (
+                current_value.rfind("@", window_start, cursor_pos) != -1
+                and self.completion_initialized
+            ):
+                self._schedule_suggestions(current_value, cursor_pos)
         except Exception:
             # If anything goes wrong, just hide suggestions
             await self._hide_suggestions()
@@ -740,57 +965,70 @@ class SessionApp(App):
         ):
             return
 
-        input_widget = self.query_one("#command-input", Input)
+        input_widget = self._command_input
         current_value = input_widget.value
         selected_suggestion = self.current_suggestions[self.selected_suggestion_index]
 
-        if self.current_suggestion_type == "slash":
-            # Replace /partial with /command
-            input_widget.value = f"/{selected_suggestion} "
-        elif self.current_suggestion_type in ["files", "enhanced_files"]:
-            # Replace @partial with @filename - handle both basic and enhanced
-            if (
-                self.current_suggestion_type == "enhanced_files"
-                and self.completion_state
-                and self.completion_state.active_mention
-            ):
-                # Enhanced completion
-                mention = self.completion_state.active_mention
-                context = self.completion_state.completion_contexts.get(
-                    mention.start_pos
-                )
-                if context:
-                    new_text = self.completion_engine.apply_completion(
-                        self.completion_state, context, selected_suggestion
-                    )
-                    input_widget.value = new_text + (
-                        " " if not selected_suggestion.endswith("/") else ""
-                    )
-                    return
+        applier = self._suggestion_appliers.get(self.current_suggestion_type)
+        if applier is not None:
+            applier(input_widget, current_value, selected_suggestion)
 
-            # Fallback to basic completion
-            parts = current_value.split("@")
-            if len(parts) > 1:
-                base_part = "@".join(parts[:-1]) + "@"
-                input_widget.value = (
-                    base_part
-                    + selected_suggestion
-                    + (" " if not selected_suggestion.endswith("/") else "")
+    def _apply_slash_suggestion(
+        self, input_widget: Input, current_value: str, selected_suggestion: str
+    ) -> None:
+        """Replace /partial with /command."""
+        input_widget.value = f"/{selected_suggestion} "
+
+    def _apply_file_suggestion(
+        self, input_widget: Input, current_value: str, selected_suggestion: str
+    ) -> None:
+        """Replace @partial with @filename - handle both basic and enhanced."""
+        if (
+            self.current_suggestion_type == "enhanced_files"
+            and self.completion_state
+            and self.completion_state.active_mention
+        ):
+            # Enhanced completion
+            mention = self.completion_state.active_mention
+            context = self.completion_state.completion_contexts.get(mention.start_pos)
+            if context:
+                new_text = self.completion_engine.apply_completion(
+                    self.completion_state, context, selected_suggestion
                 )
-            else:
-                input_widget.value = f"@{selected_suggestion} "
-        elif self.current_suggestion_type == "bash":
-            # Replace >partial with >command
-            input_widget.value = f">{selected_suggestion}"
-        elif self.current_suggestion_type == "memory":
-            # Replace #partial with #command
-            input_widget.value = f"#{selected_suggestion} "
+                input_widget.value = new_text + (
+                    " " if not selected_suggestion.endswith("/") else ""
+                )
+                return
+
+        # Fallback to basic completion: replace the mention before the cursor
+        input_widget.value, input_widget.cursor_position = _insert_file_mention(
+            current_value, input_widget.cursor_position, selected_suggestion
+        )
+
+    def _apply_bash_suggestion(
+        self, input_widget: Input, current_value: str, selected_suggestion: str
+    ) -> None:
+        """Replace >partial with >command."""
+        input_widget.value = f">{selected_suggestion}"
+
+    def _apply_memory_suggestion(
+        self, input_widget: Input, current_value: str, selected_suggestion: str
+    ) -> None:
+        """Replace #partial with #command."""
+        input_widget.value = f"#{selected_suggestion} "
 
     async def _hide_suggestions(self) -> None:
         """Hide the suggestions list."""
-        suggestions_list = self.query_one("#suggestions-list", ListView)
+        if not self.suggestions_visible and not self._suggestion_items:
+            return  # Already hidden and empty; nothing to reset
+
+        suggestions_list = self._suggestions_list
         suggestions_list.set_class(True, "hidden")
         suggestions_list.clear()
+        self._suggestion_items = []
+        self._suggestion_rows = ()
+        self._selectable_items = []
+        self._highlighted_item = None
         self.suggestions_visible = False
         self.current_suggestions = []
         self.current_suggestion_type = ""
@@ -799,23 +1037,28 @@ class SessionApp(App):
     async def on_click(self, event: Click) -> None:
         """Handle click events to focus input."""
         # Always focus the command input when clicking anywhere in the TUI
-        input_widget = self.query_one("#command-input", Input)
+        input_widget = self._command_input
         input_widget.focus()
 
     async def on_key(self, event: Key) -> None:
         """Handle key events for suggestion navigation and command history."""
+        if event.key in self.SUGGESTION_KEYS:
+            # Navigation and completion must see suggestions for what is
+            # typed now, even inside the debounce window
+            await self._flush_suggestions()
+
         if self.suggestions_visible:
             if event.key == "up":
                 # Move selection up in suggestions
                 if self.selected_suggestion_index > 0:
                     self.selected_suggestion_index -= 1
-                    await self._update_suggestion_highlight()
+                    self._schedule_highlight()
                 event.prevent_default()
             elif event.key == "down":
                 # Move selection down in suggestions
                 if self.selected_suggestion_index < len(self.current_suggestions) - 1:
                     self.selected_suggestion_index += 1
-                    await self._update_suggestion_highlight()
+                    self._schedule_highlight()
                 event.prevent_default()
             elif event.key == "tab":
                 # Enhanced tab completion with path expansion
@@ -834,7 +1077,7 @@ class SessionApp(App):
                 # Don't prevent default - let it fall through to action_cancel_or_quit
         else:
             # Handle command history navigation when not in suggestions mode
-            input_widget = self.query_one("#command-input", Input)
+            input_widget = self._command_input
 
             if event.key == "up":
                 # Handle up arrow: cursor navigation first, then history
@@ -885,68 +1128,64 @@ class SessionApp(App):
         self.service.set_detail_mode(self.detail_mode)
 
         # Show feedback
-        log = self.query_one("#content-log")
         mode_text = "Detailed" if self.detail_mode else "Summary"
-        log.mount(Static(f"🔄 File content mode: {mode_text}", classes="system-message"))
-        log.scroll_end()
+        self._log_system_messages(f"🔄 File content mode: {mode_text}")
 
     async def action_cycle_model(self) -> None:
         """Cycle through available AI models with context optimization."""
         current_model = self.service.get_current_model_name()
-
-        # Define model cycle order
-        models = ["local", "claude", "gemini"]
-        try:
-            current_index = models.index(current_model)
-            next_index = (current_index + 1) % len(models)
-            next_model = models[next_index]
-        except ValueError:
-            next_model = "local"  # Default fallback
+        next_model = self.NEXT_MODEL.get(current_model, "local")  # Default fallback
 
         # Switch model with context optimization
         result = self.service.switch_model_with_context(next_model)
+        self._sync_model_cache()
 
-        # Show feedback with optimization stats
-        log = self.query_one("#content-log")
+        # Show feedback with optimization stats as a single log message
 
         # Basic switch message
-        log.mount(Static(result["message"], classes="system-message"))
+        message = result["message"]
 
-        # Context optimization stats
-        opt_stats = result["context_optimization"]
-        if opt_stats["original_length"] > 0:
-            stats_msg = (
-                f"📊 Context optimized: {opt_stats['compression_ratio']}x compression, "
+        # Context optimization stats, when there was context to optimize
+        opt_stats = result.get("context_optimization") or {}
+        if opt_stats.get("original_length", 0) > 0:
+            message += (
+                f"\n📊 Context optimized: {opt_stats['compression_ratio']}x compression, "
                 f"{opt_stats['quality_score']} quality score"
             )
-            log.mount(Static(stats_msg, classes="system-message"))
 
-        log.scroll_end()
+        self._log_system_messages(message)
 
     async def action_quit(self) -> None:
         """Quit the application with session summary and cleanup."""
+        await self._cancel_pending_tasks()
         self._clear_terminal_on_exit()
         self._show_terminal_session_summary()
         self.exit()
 
+    async def _cancel_pending_tasks(self) -> None:
+        """Cancel in-flight work and wait briefly for it to unwind before exit."""
+        tasks = [
+            task
+            for task in (
+                self.current_task,
+                self._streaming_task,
+                self._suggestion_task,
+                self._quit_hint_task,
+            )
+            if task is not None and not task.done()
+        ]
+        if not tasks:
+            return
+        for task in tasks:
+            task.cancel()
+        await asyncio.wait(tasks, timeout=self.SHUTDOWN_TIMEOUT_SECONDS)
+
     def _show_terminal_session_summary(self) -> None:
         """Show session summary in the terminal after TUI closes."""
-        # Count interactions from the log
-        log = self.query_one("#content-log")
-        user_messages = len(
-            [
-                w
-                for w in log.children
-                if hasattr(w, "classes") and "user-message" in str(w.classes)
-            ]
-        )
-        ai_responses = len(
-            [
-                w
-                for w in log.children
-                if hasattr(w, "classes") and "ai-response" in str(w.classes)
-            ]
-        )
+        # Interactions are counted as they are logged, so trimmed or cleared
+        # messages still count towards the session
+        user_messages = self._user_message_count
+        ai_responses = self._ai_response_count
         files_accessed = len(self.service.get_recent_files_suggestions())
 
         # Print directly to terminal (will appear after TUI closes)
@@ -975,36 +1214,21 @@ class SessionApp(App):
         if not text:
             return False  # No text, can't navigate
 
-        lines = text.split("\n")
-
-        # Find current line and position within line
-        current_line_idx = 0
-        char_count = 0
-        pos_in_line = cursor_pos
-
-        for i, line in enumerate(lines):
-            if char_count + len(line) + (1 if i < len(lines) - 1 else 0) >= cursor_pos:
-                current_line_idx = i
-                pos_in_line = cursor_pos - char_count
-                break
-            char_count += len(line) + 1  # +1 for newline
+        # Locate the current line by scanning for the surrounding newlines
+        line_start = text.rfind("\n", 0, cursor_pos) + 1
+        pos_in_line = cursor_pos - line_start
 
         if direction == "up":
-            if current_line_idx > 0:
+            if line_start > 0:
                 # Move to same position in line above
-                target_line = lines[current_line_idx - 1]
-                new_pos_in_line = min(pos_in_line, len(target_line))
-
-                # Calculate new cursor position
-                new_cursor_pos = sum(
-                    len(lines[i]) + 1 for i in range(current_line_idx - 1)
+                prev_end = line_start - 1  # The newline ending the line above
+                prev_start = text.rfind("\n", 0, prev_end) + 1
+                input_widget.cursor_position = prev_start + min(
+                    pos_in_line, prev_end - prev_start
                 )
-                new_cursor_pos += new_pos_in_line
-                input_widget.cursor_position = new_cursor_pos
                 return True
             elif cursor_pos > 0:
                 # At first line but not at start - go to start of line
-                line_start = sum(len(lines[i]) + 1 for i in range(current_line_idx))
                 input_widget.cursor_position = line_start
                 return True
             else:
@@ -1012,23 +1236,20 @@ class SessionApp(App):
                 return False
 
         elif direction == "down":
-            if current_line_idx < len(lines) - 1:
+            line_end = text.find("\n", cursor_pos)
+            if line_end != -1:
                 # Move to same position in line below
-                target_line = lines[current_line_idx + 1]
-                new_pos_in_line = min(pos_in_line, len(target_line))
-
-                # Calculate new cursor position
-                new_cursor_pos = sum(
-                    len(lines[i]) + 1 for i in range(current_line_idx + 1)
+                next_start = line_end + 1
+                next_end = text.find("\n", next_start)
+                if next_end == -1:
+                    next_end = len(text)
+                input_widget.cursor_position = next_start + min(
+                    pos_in_line, next_end - next_start
                 )
-                new_cursor_pos += new_pos_in_line
-                input_widget.cursor_position = new_cursor_pos
                 return True
             elif cursor_pos < len(text):
                 # At last line but not at end - go to end of line
-                current_line = lines[current_line_idx]
-                line_start = sum(len(lines[i]) + 1 for i in range(current_line_idx))
-                input_widget.cursor_position = line_start + len(current_line)
+                input_widget.cursor_position = len(text)
                 return True
             else:
                 # At end of last line - can't move down
@@ -1038,18 +1259,25 @@ class SessionApp(App):
 
     async def _show_quit_hint(self, message: str, duration: float = 3.0) -> None:
         """Show a temporary quit hint between the content log and input area."""
-        quit_hint = self.query_one("#quit-hint", Static)
+        quit_hint = self._quit_hint
         quit_hint.update(message)
         quit_hint.set_class(False, "hidden")
 
-        # Auto-hide after duration using a background task to not block
-        asyncio.create_task(self._hide_quit_hint_after(duration))
+        # Auto-hide after duration using a background task to not block; a
+        # newer hint restarts the timer so an older one can't hide it early
+        if self._quit_hint_task is not None and not self._quit_hint_task.done():
+            self._quit_hint_task.cancel()
+        self._quit_hint_task = asyncio.create_task(self._hide_quit_hint_after(duration))
 
     async def _hide_quit_hint_after(self, duration: float) -> None:
         """Hide quit hint after a delay."""
-        await asyncio.sleep(duration)
         try:
-            quit_hint = self.query_one("#quit-hint", Static)
+            await asyncio.sleep(duration)
+        except asyncio.CancelledError:
+            # Superseded by a newer hint
+            return
+        try:
+            quit_hint = self._quit_hint
             quit_hint.set_class(True, "hidden")
         except Exception:
             # Widget might be gone if app is shutting down
@@ -1057,45 +1285,32 @@ class SessionApp(App):
 
     def _clear_terminal_on_exit(self) -> None:
         """Clear the terminal when exiting to avoid splash screen clutter."""
-        import os
-        import subprocess
-
         try:
-            # Clear screen using standard terminal command
             if os.name == "nt":  # Windows
-                subprocess.run("cls", shell=True)
+                os.system("cls")
             else:  # Unix/Linux/macOS
-                subprocess.run("clear", shell=True)
+                # Clear screen and scrollback, then home the cursor; writing the
+                # ANSI sequence avoids spawning a `clear` process
+                sys.stdout.write("\x1b[2J\x1b[3J\x1b[H")
+                sys.stdout.flush()
         except Exception:
             # Fallback: print enough newlines to push content off screen
             print("\n" * 50)
 
     async def action_cancel_or_quit(self) -> None:
         """Cancel current input, interrupt streaming, or quit on second press."""
-        import time
-
-        current_time = time.time()
+        # Monotonic, so clock adjustments can't stretch or cut the window
+        current_time = time.monotonic()
 
         # Check if we're currently processing or streaming - interrupt it
         if self.current_task and not self.current_task.done():
             self.current_task.cancel()
-            log = self.query_one("#content-log")
-            log.mount(
-                Static("⚠️ Generation interrupted by user", classes="system-message")
-            )
-            log.scroll_end()
-            await self._show_quit_hint(
-                "⚠️ Generation stopped. Press Esc/Ctrl+C again to exit TUI", 3.0
-            )
-            self.last_cancel_time = current_time
-            return
-        elif self.current_streaming_widget and self.current_streaming_widget.streaming:
-            self.current_streaming_widget.stop_streaming()
-            log = self.query_one("#content-log")
-            log.mount(
-                Static("⚠️ Generation interrupted by user", classes="system-message")
-            )
-            log.scroll_end()
+            interrupted = True
+        else:
+            interrupted = self._cancel_streaming()
+
+        if interrupted:
+            self._log_system_messages("⚠️ Generation interrupted by user")
             await self._show_quit_hint(
                 "⚠️ Generation stopped. Press Esc/Ctrl+C again to exit TUI", 3.0
             )
@@ -1103,7 +1318,7 @@ class SessionApp(App):
             return
 
         # Check if input has content - clear it first
-        input_widget = self.query_one("#command-input", Input)
+        input_widget = self._command_input
         if input_widget.value.strip():
             input_widget.value = ""
             # Show cancel hint in quit hint area
@@ -1123,5 +1338,8 @@ class SessionApp(App):
 
 
 if __name__ == "__main__":
+    from .main import _install_uvloop
+
     app = SessionApp()
+    _install_uvloop()  # Same loop policy as the letshack entry point
     app.run()
@@ -3,12 +3,50 @@ Basic Context Engine - Open Source version with essential context persistence.
 Simplified version of the full context engine for community use.
 """
 
+import atexit
+import heapq
 import json
+import os
+import re
+import threading
+import time
+import weakref
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # Optional speedup, from the "speed" extra
+    _HAS_ORJSON = False
+
+
+def _encode_json(data: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON, using orjson when it is installed."""
+    if _HAS_ORJSON:
+        # Like json.dumps below: non-str keys become strings, and datetimes
+        # and dataclasses go through str() instead of orjson's own formats
+        encoded: bytes = orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS,
+        )
+        return encoded
+    text = json.dumps(data, default=str, ensure_ascii=False, separators=(",", ":"))
+    return text.encode("utf-8")
+
+
+def _decode_json(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if _HAS_ORJSON:
+        return orjson.loads(raw)  # orjson.JSONDecodeError subclasses json's
+    return json.loads(raw)
 
 
 class ContextType(Enum):
@@ -44,48 +82,29 @@ class OptimizedContext:
 class BasicContextClassifier:
     """Simple keyword-based context classification for open source."""
 
-    def classify_segment(self, text: str) -> ContextType:
-        text_lower = text.lower()
+    # Keyword alternations per type, checked in priority order below; each
+    # is one regex pass over the text instead of a substring scan per keyword
+    _STRATEGIC_RE = re.compile(
+        r"architecture|design|approach|strategy|plan|goal|overview", re.IGNORECASE
+    )
+    _DEBUG_RE = re.compile(
+        r"error|bug|fix|debug|issue|problem|traceback|exception", re.IGNORECASE
+    )
+    _IMPL_RE = re.compile(
+        r"function|class|method|implement|code|variable|import|def", re.IGNORECASE
+    )
 
+    def classify_segment(self, text: str) -> ContextType:
         # Strategic indicators - high-level planning and architecture
-        strategic_keywords = [
-            "architecture",
-            "design",
-            "approach",
-            "strategy",
-            "plan",
-            "goal",
-            "overview",
-        ]
-        if any(keyword in text_lower for keyword in strategic_keywords):
+        if self._STRATEGIC_RE.search(text):
             return ContextType.STRATEGIC
 
         # Debug indicators - error handling and troubleshooting
-        debug_keywords = [
-            "error",
-            "bug",
-            "fix",
-            "debug",
-            "issue",
-            "problem",
-            "traceback",
-            "exception",
-        ]
-        if any(keyword in text_lower for keyword in debug_keywords):
+        if self._DEBUG_RE.search(text):
             return ContextType.DEBUG
 
         # Implementation indicators - code and technical details
-        impl_keywords = [
-            "function",
-            "class",
-            "method",
-            "implement",
-            "code",
-            "variable",
-            "import",
-            "def",
-        ]
-        if any(keyword in text_lower for keyword in impl_keywords):
+        if self._IMPL_RE.search(text):
             return ContextType.IMPLEMENTATION
 
         # Default to chat for casual conversation
@@ -130,36 +149,35 @@ class BasicContextEngine:
 
     def segment_conversation(self, conversation: str) -> List[ContextSegment]:
         """Break conversation into typed segments with timestamps."""
-        lines = conversation.split("\n")
+        classify = self.classifier.classify_segment
+        # Segments from one call share a timestamp; read the clock once
+        now = datetime.now()
         segments = []
 
         current_segment: List[str] = []
-        current_type = None
-
-        for line in lines:
-            if line.strip():
-                line_type = self.classifier.classify_segment(line)
-
-                if current_type is None:
-                    current_type = line_type
-
-                if line_type != current_type:
-                    # Finish current segment
-                    if current_segment:
-                        segments.append(
-                            ContextSegment(
-                                content="\n".join(current_segment),
-                                segment_type=current_type,
-                                importance_score=0.0,  # Will be set later
-                                timestamp=datetime.now(),
-                            )
-                        )
-
-                    # Start new segment
-                    current_segment = [line]
-                    current_type = line_type
-                else:
-                    current_segment.append(line)
+        current_type: Optional[ContextType] = None
+
+        for line in conversation.split("\n"):
+            if not line.strip():
+                continue
+
+            line_type = classify(line)
+            if line_type == current_type:
+                current_segment.append(line)
+                continue
+
+            # Finish current segment and start a new one
+            if current_segment and current_type:
+                segments.append(
+                    ContextSegment(
+                        content="\n".join(current_segment),
+                        segment_type=current_type,
+                        importance_score=0.0,  # Will be set later
+                        timestamp=now,
+                    )
+                )
+            current_segment = [line]
+            current_type = line_type
 
         # Add final segment
         if current_segment and current_type:
@@ -168,7 +186,7 @@ class BasicContextEngine:
                     content="\n".join(current_segment),
                     segment_type=current_type,
                     importance_score=0.0,
-                    timestamp=datetime.now(),
+                    timestamp=now,
                 )
             )
 
@@ -189,29 +207,58 @@ class BasicContextEngine:
         self, segments: List[ContextSegment], max_length: int = 4000
     ) -> str:
         """Optimize context by importance, respecting length limits."""
-        # Sort by importance score (descending)
-        sorted_segments = sorted(
-            segments, key=lambda s: s.importance_score, reverse=True
-        )
-
-        optimized_content = []
+        return self._select_segments(segments, max_length)[0]
+
+    def _select_segments(
+        self, segments: List[ContextSegment], max_length: int
+    ) -> Tuple[str, Set[int]]:
+        """Build optimized context and the indices of fully kept segments."""
+        optimized_content: List[str] = []
+        kept: Set[int] = set()
         current_length = 0
 
-        for segment in sorted_segments:
-            segment_length = len(segment.content)
+        for i in self._by_importance(segments, max_length):
+            segment = segments[i]
+            # Count the newline that will join this segment to the previous one
+            separator = 1 if optimized_content else 0
+            segment_length = len(segment.content) + separator
 
             if current_length + segment_length <= max_length:
                 optimized_content.append(segment.content)
+                kept.add(i)
                 current_length += segment_length
             else:
                 # Try to fit partial segment if there's meaningful space
-                remaining = max_length - current_length
+                remaining = max_length - current_length - separator
                 if remaining > 100:
                     partial = segment.content[: remaining - 3] + "..."
                     optimized_content.append(partial)
                 break
 
-        return "\n".join(optimized_content)
+        return "\n".join(optimized_content), kept
+
+    @staticmethod
+    def _by_importance(
+        segments: List[ContextSegment], max_length: int
+    ) -> Iterator[int]:
+        """Yield segment indices by importance score, highest first.
+
+        Selection usually stops after the first few segments, so only a
+        bounded head is ranked with a heap; the remainder is sorted only if
+        selection gets that far. Ties keep conversation order, as with sorted.
+        """
+
+        def importance(i: int) -> float:
+            return segments[i].importance_score
+
+        count = len(segments)
+        head = max(16, max_length // 32)
+        if count <= head:
+            yield from sorted(range(count), key=importance, reverse=True)
+            return
+
+        yield from heapq.nlargest(head, range(count), key=importance)
+        yield from sorted(range(count), key=importance, reverse=True)[head:]
 
     def optimize_handoff(
         self,
@@ -231,7 +278,7 @@ class BasicContextEngine:
         weighted_segments = self.apply_weights(segments, target_model_enum)
 
         # Optimize for length constraints
-        optimized_content = self.optimize_context(weighted_segments, max_length)
+        optimized_content, kept = self._select_segments(weighted_segments, max_length)
 
         # Calculate basic metrics
         original_length = len(conversation)
@@ -240,14 +287,17 @@ class BasicContextEngine:
             optimized_length / original_length if original_length > 0 else 1.0
         )
 
-        # Simple quality score based on preserved important segments
+        # Simple quality score based on preserved important segments. A
+        # segment counts as preserved when a kept segment has the same content,
+        # which is a set lookup rather than a search through the output
+        kept_contents = {weighted_segments[i].content for i in kept}
         important_segments = [
             s
             for s in weighted_segments
-            if s.segment_type in [ContextType.STRATEGIC, ContextType.IMPLEMENTATION]
+            if s.segment_type in (ContextType.STRATEGIC, ContextType.IMPLEMENTATION)
         ]
         preserved_important = sum(
-            1 for s in important_segments if s.content in optimized_content
+            1 for s in important_segments if s.content in kept_contents
         )
         quality_score = (
             preserved_important / len(important_segments) if important_segments else 1.0
@@ -265,40 +315,83 @@ class BasicContextEngine:
 class BasicSessionManager:
     """Basic session persistence for open source."""
 
+    SAVE_INTERVAL_SECONDS = 2.0  # Coalesce session writes within this window
+
     def __init__(self, data_dir: str = "~/.aihack"):
         self.data_dir = Path(data_dir).expanduser()
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.sessions_file = self.data_dir / "sessions.json"
         self.sessions = self._load_sessions()
+        self._dirty = False  # In-memory sessions differ from the file
+        self._last_save = float("-inf")
+        self._flush_timer: Optional[threading.Timer] = None
+        # Guards sessions against the flush timer's thread
+        self._lock = threading.RLock()
+        # Write out anything still pending when the process exits
+        _live_session_managers.add(self)
 
     def _load_sessions(self) -> Dict[str, Any]:
         """Load existing sessions from disk."""
         if self.sessions_file.exists():
             try:
-                with open(self.sessions_file, "r") as f:
-                    loaded_data = json.load(f)
+                with open(self.sessions_file, "rb") as f:
+                    loaded_data = _decode_json(f.read())
                     return loaded_data if isinstance(loaded_data, dict) else {}
             except (json.JSONDecodeError, FileNotFoundError):
                 return {}
         return {}
 
     def _save_sessions(self) -> None:
-        """Save sessions to disk."""
-        try:
-            with open(self.sessions_file, "w") as f:
-                json.dump(self.sessions, f, indent=2, default=str)
-        except Exception as e:
-            print(f"Warning: Could not save session data: {e}")
+        """Save sessions to disk, at most once per SAVE_INTERVAL_SECONDS.
+
+        Sessions always live in memory; changes made within the interval are
+        written by a timer when it ends, or by flush() at exit.
+        """
+        with self._lock:
+            self._dirty = True
+            elapsed = time.monotonic() - self._last_save
+            if elapsed >= self.SAVE_INTERVAL_SECONDS:
+                self.flush()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(
+                    self.SAVE_INTERVAL_SECONDS - elapsed, self.flush
+                )
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Write pending session changes to disk now."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return
+            # Write a sibling file and swap it in, so a crash mid-write never
+            # leaves a truncated sessions.json behind
+            tmp_file = self.sessions_file.with_suffix(".json.tmp")
+            try:
+                with open(tmp_file, "wb") as f:
+                    f.write(_encode_json(self.sessions))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self.sessions_file)
+            except Exception as e:
+                print(f"Warning: Could not save session data: {e}")
+                return
+            self._dirty = False
+            self._last_save = time.monotonic()
 
     def save_session_context(self, session_id: str, context: str, model: str) -> None:
         """Save current context for session."""
-        self.sessions[session_id] = {
-            "context": context,
-            "model": model,
-            "last_updated": datetime.now().isoformat(),
-            "message_count": len(context.split("\n")),
-        }
-        self._save_sessions()
+        with self._lock:
+            self.sessions[session_id] = {
+                "context": context,
+                "model": model,
+                "last_updated": datetime.now().isoformat(),
+                "message_count": context.count("\n") + 1,  # Lines, without a split
+            }
+            self._save_sessions()
 
     def restore_session_context(self, session_id: str) -> Optional[Tuple[str, str]]:
         """Restore context for session if it exists."""
@@ -339,16 +432,27 @@ class BasicSessionManager:
                 # Invalid date format, remove old session
                 sessions_to_remove.append(session_id)
 
-        for session_id in sessions_to_remove:
-            del self.sessions[session_id]
-            removed_count += 1
+        with self._lock:
+            for session_id in sessions_to_remove:
+                del self.sessions[session_id]
+                removed_count += 1
 
-        if removed_count > 0:
-            self._save_sessions()
+            if removed_count > 0:
+                self._save_sessions()
 
         return removed_count
 
 
+_live_session_managers: "weakref.WeakSet[BasicSessionManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_session_managers() -> None:
+    """Write pending changes of every session manager still alive at exit."""
+    for manager in list(_live_session_managers):
+        manager.flush()
+
+
 # Simple CLI integration class
 class BasicCLIContextManager:
     """Basic CLI context management for open source."""
@@ -1,6 +1,7 @@
 """Centralized task registry for AI-Hack - single source of truth."""
 
-from typing import Any, Dict, List
+from types import MappingProxyType
+from typing import Any, List, Mapping
 
 from ..types.prompts import TaskType
 
@@ -16,6 +17,53 @@ class TaskRegistry:
         "favour": "favor",  # GB spelling (if we add favor task later)
     }
 
+    # Per-task configuration, built once with the class and shared read-only
+    TASK_CONFIGS: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+        {
+            task: MappingProxyType(config)
+            for task, config in {
+                TaskType.ANALYZE.value: {
+                    "description": "Analyze code structure and organization",
+                    "prompt_style": "structured",
+                    "expected_output": "4-aspect analysis",
+                },
+                TaskType.REVIEW.value: {
+                    "description": "Review code for issues and improvements",
+                    "prompt_style": "ultra_tight",
+                    "expected_output": "issue/fix/priority format",
+                },
+                TaskType.SECURITY.value: {
+                    "description": "Scan for security vulnerabilities",
+                    "prompt_style": "tight",
+                    "expected_output": "vulnerability detection",
+                },
+                TaskType.REFACTOR.value: {
+                    "description": "Suggest code refactoring improvements",
+                    "prompt_style": "structured",
+                    "expected_output": "refactoring suggestions",
+                },
+                TaskType.OPTIMIZE.value: {
+                    "description": "Identify performance optimization opportunities",
+                    "prompt_style": "structured",
+                    "expected_output": "performance improvements",
+                },
+                TaskType.DEBUG.value: {
+                    "description": "Help debug code issues and errors",
+                    "prompt_style": "tight",
+                    "expected_output": "debugging assistance",
+                },
+            }.items()
+        }
+    )
+    # Returned for names that aren't a known task
+    UNKNOWN_TASK_CONFIG: Mapping[str, Any] = MappingProxyType(
+        {
+            "description": "Unknown task",
+            "prompt_style": "structured",
+            "expected_output": "analysis",
+        }
+    )
+
     @classmethod
     def get_all_task_names(cls) -> List[str]:
         """Get list of all valid task names."""
@@ -34,50 +82,10 @@ class TaskRegistry:
         return resolved_task in cls.get_all_task_names()
 
     @classmethod
-    def get_task_config(cls, task_name: str) -> Dict[str, Any]:
-        """Get configuration for a specific task (resolves aliases)."""
+    def get_task_config(cls, task_name: str) -> Mapping[str, Any]:
+        """Get a read-only configuration for a task (resolves aliases)."""
         resolved_task = cls.resolve_task_alias(task_name)
-        configs = {
-            TaskType.ANALYZE.value: {
-                "description": "Analyze code structure and organization",
-                "prompt_style": "structured",
-                "expected_output": "4-aspect analysis",
-            },
-            TaskType.REVIEW.value: {
-                "description": "Review code for issues and improvements",
-                "prompt_style": "ultra_tight",
-                "expected_output": "issue/fix/priority format",
-            },
-            TaskType.SECURITY.value: {
-                "description": "Scan for security vulnerabilities",
-                "prompt_style": "tight",
-                "expected_output": "vulnerability detection",
-            },
-            TaskType.REFACTOR.value: {
-                "description": "Suggest code refactoring improvements",
-                "prompt_style": "structured",
-                "expected_output": "refactoring suggestions",
-            },
-            TaskType.OPTIMIZE.value: {
-                "description": "Identify performance optimization opportunities",
-                "prompt_style": "structured",
-                "expected_output": "performance improvements",
-            },
-            TaskType.DEBUG.value: {
-                "description": "Help debug code issues and errors",
-                "prompt_style": "tight",
-                "expected_output": "debugging assistance",
-            },
-        }
-
-        return configs.get(
-            resolved_task,
-            {
-                "description": "Unknown task",
-                "prompt_style": "structured",
-                "expected_output": "analysis",
-            },
-        )
+        return cls.TASK_CONFIGS.get(resolved_task, cls.UNKNOWN_TASK_CONFIG)
 
     @classmethod
     def get_default_task(cls) -> str:
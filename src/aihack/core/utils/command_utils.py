@@ -1,4 +1,5 @@
 """Pure utility functions for command processing and help text generation."""
+import functools
 import re
 from typing import Dict, List, Tuple
 
@@ -103,6 +104,25 @@ def build_command_registry() -> Dict[str, Dict[str, str]]:
     return commands
 
 
+@functools.lru_cache(maxsize=1)
+def _slash_command_entries() -> Tuple[Dict[str, str], ...]:
+    """Build the suggestion entries once, sorted by category then command.
+
+    The registry only depends on static task configuration, so the entries and
+    their pre-rendered display strings can be shared across keystrokes.
+    """
+    entries = [
+        {
+            "command": cmd,
+            "description": info["description"],
+            "category": info["category"],
+            "display": f"⚡ /{cmd} - {info['description']}",
+        }
+        for cmd, info in build_command_registry().items()
+    ]
+    return tuple(sorted(entries, key=lambda x: (x["category"], x["command"])))
+
+
 def get_slash_command_suggestions(partial_command: str = "") -> List[Dict[str, str]]:
     """Get slash command suggestions filtered by partial input.
 
@@ -110,36 +130,18 @@ def get_slash_command_suggestions(partial_command: str = "") -> List[Dict[str, s
         partial_command: Partial command to filter by
 
     Returns:
-        List of command dictionaries with command, description, and category
+        List of command dictionaries with command, description, category and
+        a pre-rendered display string
     """
-    slash_commands = build_command_registry()
+    entries = _slash_command_entries()
 
     if not partial_command:
         # Show all commands grouped by category
-        suggestions = []
-        for cmd, info in slash_commands.items():
-            suggestions.append(
-                {
-                    "command": cmd,
-                    "description": info["description"],
-                    "category": info["category"],
-                }
-            )
-        return sorted(suggestions, key=lambda x: (x["category"], x["command"]))
+        return list(entries)
 
     # Filter commands that start with partial input
-    filtered = []
     partial_lower = partial_command.lower()
-    for cmd, info in slash_commands.items():
-        if cmd.startswith(partial_lower):
-            filtered.append(
-                {
-                    "command": cmd,
-                    "description": info["description"],
-                    "category": info["category"],
-                }
-            )
-
+    filtered = [e for e in entries if e["command"].startswith(partial_lower)]
     return sorted(filtered, key=lambda x: x["command"])
 
 
@@ -6,6 +6,9 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from .file_index import FileSystemIndex, get_file_index
 
+# An @ mention: the @ plus the reference up to whitespace or the next @
+MENTION_PATTERN = r"@([^\s@]*)"
+
 
 class CompletionType(Enum):
     """Types of file completions."""
@@ -80,10 +83,7 @@ class FileCompletionEngine:
         """Parse input text and extract file mentions with cursor awareness."""
         mentions = []
 
-        # Enhanced regex to find @ mentions with better context handling
-        pattern = r"@([^\s@]*)"
-
-        for match in re.finditer(pattern, text):
+        for match in re.finditer(MENTION_PATTERN, text):
             start_pos = match.start()
             end_pos = match.end()
             full_text = match.group(0)  # includes @
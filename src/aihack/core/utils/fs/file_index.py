@@ -1,9 +1,10 @@
 """High-performance file system indexing for smart file completion."""
+import bisect
 import time
 from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 
 @dataclass
@@ -39,6 +40,8 @@ class FileSystemIndex:
         self.files: Dict[str, FileEntry] = {}
         self.directories: Dict[str, DirectoryEntry] = {}
         self.path_segments: Dict[str, Set[str]] = defaultdict(set)
+        # Sorted segment keys, so prefix queries are a bisect range scan
+        self.sorted_segments: List[str] = []
 
         # Performance tracking
         self.last_scan_time = 0.0
@@ -139,6 +142,7 @@ class FileSystemIndex:
             self.files.clear()
             self.directories.clear()
             self.path_segments.clear()
+            self.sorted_segments = []
 
             # Scan filesystem
             await self._scan_directory(self.root_path, 0)
@@ -256,6 +260,16 @@ class FileSystemIndex:
                 if component:
                     self.path_segments[component.lower()].add(path)
 
+        self.sorted_segments = sorted(self.path_segments)
+
+    def _segments_with_prefix(self, prefix: str) -> Iterator[str]:
+        """Yield indexed segments starting with prefix in O(log n + k)."""
+        segments = self.sorted_segments
+        for i in range(bisect.bisect_left(segments, prefix), len(segments)):
+            if not segments[i].startswith(prefix):
+                break
+            yield segments[i]
+
     def get_fuzzy_matches(self, query: str, limit: int = 10) -> List[Tuple[str, float]]:
         """Get fuzzy matches for a query with relevance scoring."""
         if not query:
@@ -274,12 +288,15 @@ class FileSystemIndex:
             for path in self.path_segments[query_lower]:
                 matches.append((path, 1.0))
 
-        # Prefix matches
-        for segment, paths in self.path_segments.items():
-            if segment.startswith(query_lower) and segment != query_lower:
-                for path in paths:
-                    score = len(query_lower) / len(segment)
-                    matches.append((path, score * 0.9))
+        # Prefix matches, scored by each path's best-matching segment
+        prefix_scores: Dict[str, float] = {}
+        for segment in self._segments_with_prefix(query_lower):
+            if segment != query_lower:
+                score = len(query_lower) / len(segment) * 0.9
+                for path in self.path_segments[segment]:
+                    if score > prefix_scores.get(path, 0.0):
+                        prefix_scores[path] = score
+        matches.extend(prefix_scores.items())
 
         # Substring matches (lower priority)
         for segment, paths in self.path_segments.items():
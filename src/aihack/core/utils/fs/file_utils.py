@@ -1,8 +1,14 @@
 """Pure utility functions for file operations and path resolution."""
 import difflib
 import os
+import time
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Project walks are reused for this long, so typing an @-mention doesn't
+# re-walk the tree on every keystroke
+_LISTING_TTL_SECONDS = 2.0
+_listing_cache: Dict[Tuple[str, str], Tuple[float, List[str]]] = {}
 
 
 def resolve_file_path(file_ref: str) -> Optional[str]:
@@ -293,9 +299,46 @@ def format_file_content(file_path: str, content: str, detail_mode: bool = False)
         return f"**File: {file_path}** (Full Content)\n```\n{content}\n```"
 
 
+def _cached_listing(name: str, build: Callable[[], List[str]]) -> List[str]:
+    """Return a project listing, rebuilding it once it is older than the TTL.
+
+    Args:
+        name: Cache key for the listing kind
+        build: Function that walks the project and builds the listing
+
+    Returns:
+        Copy of the cached listing for the current working directory
+    """
+    key = (name, os.getcwd())
+    now = time.monotonic()
+    cached = _listing_cache.get(key)
+    if cached is None or now - cached[0] > _LISTING_TTL_SECONDS:
+        cached = (now, build())
+        _listing_cache[key] = cached
+    return list(cached[1])
+
+
 def _get_project_items() -> List[str]:
     """Get all project files with filtering and depth limits.
 
+    Returns:
+        List of project file paths
+    """
+    return _cached_listing("items", _walk_project_items)
+
+
+def _get_project_directories() -> List[str]:
+    """Get all project directories with filtering and depth limits.
+
+    Returns:
+        List of project directory paths
+    """
+    return _cached_listing("directories", _walk_project_directories)
+
+
+def _walk_project_items() -> List[str]:
+    """Walk the project for files and shallow directories.
+
     Returns:
         List of project file paths
     """
@@ -341,8 +384,8 @@ def _get_project_items() -> List[str]:
     return project_items
 
 
-def _get_project_directories() -> List[str]:
-    """Get all project directories with filtering and depth limits.
+def _walk_project_directories() -> List[str]:
+    """Walk the project for all directories.
 
     Returns:
         List of project directory paths
@@ -1,5 +1,6 @@
+import json
 import time
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
 import httpx
 
@@ -13,7 +14,20 @@ from ..prompts.review.local_ultra_tight import (
 )
 from ..prompts.security.local_tight import SECURITY_TIGHT_SYSTEM, SECURITY_TIGHT_USER
 from ..types.common import AnalysisResult, CodeText, TaskName
-from .base import ModelCapability, ModelError, ModelMetadata, TrustLevel
+from .base import (
+    ModelCapability,
+    ModelError,
+    ModelMetadata,
+    ModelTimeoutError,
+    ModelUnavailableError,
+    TrustLevel,
+)
+
+# Keep-alive pool shared by every request from one model instance, so
+# is_available/health_check/generate reuse the same TCP connection
+OLLAMA_POOL_LIMITS = httpx.Limits(
+    max_connections=10, max_keepalive_connections=10, keepalive_expiry=30.0
+)
 
 
 class OllamaModel:
@@ -26,7 +40,11 @@ class OllamaModel:
     ) -> None:
         self.base_url = base_url
         self.model_name = model_name
-        self.client = httpx.AsyncClient(base_url=base_url)
+        self.client = httpx.AsyncClient(
+            base_url=base_url,
+            limits=OLLAMA_POOL_LIMITS,
+            headers={"Connection": "keep-alive"},
+        )
         self.metadata = ModelMetadata(
             name=model_name,
             provider="ollama",
@@ -42,33 +60,75 @@ class OllamaModel:
             avg_response_time_ms=7000,  # Based on our testing
         )
 
+    def _request_body(
+        self, prompt: str, model: Optional[str], stream: bool
+    ) -> Dict[str, Any]:
+        """Build the /api/generate payload shared by buffered and streamed calls."""
+        return {
+            "model": model or self.model_name,
+            "prompt": prompt,
+            "stream": stream,
+            "options": {
+                "temperature": 0.1,  # Lower temperature for code tasks
+                "top_p": 0.9,
+            },
+        }
+
+    def _wrap_error(self, error: Exception) -> ModelError:
+        """Map transport failures onto the model error hierarchy."""
+        if isinstance(error, ModelError):
+            return error
+        # A connect timeout (e.g. a blackholed host) means Ollama is not reachable
+        if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout)):
+            return ModelUnavailableError(
+                f"Ollama not reachable: {str(error)}", self.metadata.name, error
+            )
+        if isinstance(error, httpx.TimeoutException):
+            return ModelTimeoutError(
+                f"Ollama request timed out: {str(error)}", self.metadata.name, error
+            )
+        return ModelError(f"Ollama API error: {str(error)}", self.metadata.name, error)
+
     async def generate(self, prompt: str, model: Optional[str] = None) -> str:
         """Generate response from local model"""
-        if model is None:
-            model = self.model_name
-
         try:
             response = await self.client.post(
                 "/api/generate",
-                json={
-                    "model": model,
-                    "prompt": prompt,
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.1,  # Lower temperature for code tasks
-                        "top_p": 0.9,
-                    },
-                },
+                json=self._request_body(prompt, model, stream=False),
                 timeout=30.0,
             )
             result = response.json()
             response_text: str = result.get("response", "")
             return response_text
         except Exception as e:
-            raise ModelError(f"Ollama API error: {str(e)}", self.metadata.name, e)
+            raise self._wrap_error(e)
 
-    async def code_review(self, code: CodeText, task: TaskName) -> AnalysisResult:
-        """Review code using ultra-tight prompts to eliminate hallucinations"""
+    async def generate_stream(
+        self, prompt: str, model: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """Generate a response from the local model, yielding tokens as they arrive"""
+        try:
+            async with self.client.stream(
+                "POST",
+                "/api/generate",
+                json=self._request_body(prompt, model, stream=True),
+                timeout=30.0,
+            ) as response:
+                # Ollama streams one JSON object per line until "done" is set
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    chunk = json.loads(line)
+                    token: str = chunk.get("response", "")
+                    if token:
+                        yield token
+                    if chunk.get("done"):
+                        break
+        except Exception as e:
+            raise self._wrap_error(e)
+
+    def _build_review_prompt(self, code: CodeText, task: TaskName) -> str:
+        """Pick the task-specific prompt pair and combine it for local models."""
         task_lower = task.lower()
 
         if task_lower == "review":
@@ -86,9 +146,15 @@ class OllamaModel:
             user_prompt = REVIEW_ULTRA_TIGHT_USER.format(code=code)
 
         # Combine system and user prompts for local models
-        full_prompt = f"{system_prompt}\n\n{user_prompt}"
+        return f"{system_prompt}\n\n{user_prompt}"
 
-        return await self.generate(full_prompt)
+    async def code_review(self, code: CodeText, task: TaskName) -> AnalysisResult:
+        """Review code using ultra-tight prompts to eliminate hallucinations"""
+        return await self.generate(self._build_review_prompt(code, task))
+
+    def code_review_stream(self, code: CodeText, task: TaskName) -> AsyncIterator[str]:
+        """Streaming variant of code_review that yields tokens as generated"""
+        return self.generate_stream(self._build_review_prompt(code, task))
 
     async def analyze_code(self, code: CodeText) -> AnalysisResult:
         """Analyze code structure using structured prompts"""
@@ -98,6 +164,10 @@ class OllamaModel:
         full_prompt = f"{system_prompt}\n\n{user_prompt}"
         return await self.generate(full_prompt)
 
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and its keep-alive connections."""
+        await self.client.aclose()
+
     async def is_available(self) -> bool:
         """Check if Ollama service is available"""
         try:
@@ -0,0 +1,87 @@
+import asyncio
+import os
+import sys
+import types
+from pathlib import Path
+from typing import Iterator
+
+import httpx
+import pytest
+
+from aihack.cli import main
+from aihack.models.local import OllamaModel
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("error", [httpx.ConnectTimeout, httpx.ReadTimeout])
+async def test_hack_reports_unavailable_when_first_token_times_out(
+    error: type,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise error("timed out", request=request)
+
+    agent = OllamaModel()
+    agent.client = httpx.AsyncClient(
+        base_url=agent.base_url, transport=httpx.MockTransport(handler)
+    )
+    monkeypatch.setattr(main, "_ollama", agent)
+    code_file = tmp_path / "example.py"
+    code_file.write_text("x = 1\n")
+
+    await main._hack_async(str(code_file), "review", "local", False, "high")
+
+    assert "Local model (Ollama) not available" in capsys.readouterr().out
+
+
+def test_read_code_file_translates_newlines_like_text_mode(tmp_path: Path) -> None:
+    code_file = tmp_path / "example.py"
+    code_file.write_bytes("x = 1\r\ny = 'é'\rz = 3\n".encode("utf-8"))
+
+    assert main._read_code_file(str(code_file)) == "x = 1\ny = 'é'\nz = 3\n"
+
+
+@pytest.mark.skipif(not os.path.isdir("/dev/fd"), reason="needs /dev/fd")
+def test_read_code_file_reads_pipes() -> None:
+    read_fd, write_fd = os.pipe()
+    with os.fdopen(write_fd, "w") as writer:
+        writer.write("print('piped')\r\n")
+    try:
+        assert main._read_code_file(f"/dev/fd/{read_fd}") == "print('piped')\n"
+    finally:
+        os.close(read_fd)
+
+
+class FakeUvloopPolicy(asyncio.DefaultEventLoopPolicy):
+    pass
+
+
+@pytest.fixture
+def restore_loop_policy() -> Iterator[None]:
+    yield
+    asyncio.set_event_loop_policy(None)
+
+
+def test_install_uvloop_sets_its_policy(
+    monkeypatch: pytest.MonkeyPatch, restore_loop_policy: None
+) -> None:
+    fake_uvloop = types.ModuleType("uvloop")
+    fake_uvloop.EventLoopPolicy = FakeUvloopPolicy  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "uvloop", fake_uvloop)
+
+    main._install_uvloop()
+
+    assert isinstance(asyncio.get_event_loop_policy(), FakeUvloopPolicy)
+
+
+def test_install_uvloop_keeps_default_policy_without_uvloop(
+    monkeypatch: pytest.MonkeyPatch, restore_loop_policy: None
+) -> None:
+    monkeypatch.setitem(sys.modules, "uvloop", None)  # Import raises ImportError
+    policy = asyncio.get_event_loop_policy()
+
+    main._install_uvloop()
+
+    assert asyncio.get_event_loop_policy() is policy
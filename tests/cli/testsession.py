@@ -0,0 +1,30 @@
+import pytest
+
+from aihack.cli.session import _MENTION_RE, _insert_file_mention
+from aihack.core.utils.fs.file_completion import FileCompletionEngine
+
+
+@pytest.mark.parametrize(
+    ("text", "cursor", "suggestion", "expected"),
+    [
+        ("@sr and @te", 3, "src/main.py", ("@src/main.py and @te", 13)),
+        ("@sr and @te", 11, "tests/", ("@sr and @tests/", 15)),
+        ("look at @ma", 11, "main.py", ("look at @main.py ", 17)),
+        ("@sr/x.py", 3, "src/", ("@src/", 5)),
+        ("no mention", 10, "main.py", ("@main.py ", 9)),
+    ],
+)
+def test_insert_file_mention_replaces_only_the_mention_at_the_cursor(
+    text: str, cursor: int, suggestion: str, expected: tuple
+) -> None:
+    assert _insert_file_mention(text, cursor, suggestion) == expected
+
+
+@pytest.mark.parametrize(
+    "text", ["@src", "see @src", "x@foo", "a@b@c", "@", "plain text", "@done "]
+)
+def test_mention_at_cursor_agrees_with_parse_input(text: str) -> None:
+    match = _MENTION_RE.search(text, 0, len(text))
+    active = FileCompletionEngine().parse_input(text, len(text)).active_mention
+
+    assert (match.group(1) if match else None) == (active.file_ref if active else None)
@@ -0,0 +1,38 @@
+from fractions import Fraction
+from typing import List
+
+import pytest
+
+from aihack.cli.session import StreamingText
+
+
+def per_character_schedule(content: str, speed: Fraction) -> List[int]:
+    """Characters shown after each frame by the original per-character loop."""
+    frame = Fraction(1, 60)
+    shown: List[int] = []
+    revealed = 0
+    budget = Fraction(0)
+    while revealed < len(content):
+        budget += frame
+        end = revealed
+        while end < len(content) and budget > 0:
+            char = content[end]
+            if char in ".,!?":
+                budget -= speed * 3  # Pause at punctuation
+            elif char == " ":
+                budget -= speed / 2  # Faster through spaces
+            else:
+                budget -= speed
+            end += 1
+        revealed = end
+        shown.append(end)
+    return shown
+
+
+@pytest.mark.parametrize("speed", ["0.015", "0.02", "0.005"])
+def test_reveal_schedule_matches_per_character_loop(speed: str) -> None:
+    content = "Hello there, friend. Pauses... at punctuation!\nNext line? ✨ Yes.\n" * 3
+
+    frames = list(StreamingText(content)._frame_ends(float(speed)))
+
+    assert frames == per_character_schedule(content, Fraction(speed))
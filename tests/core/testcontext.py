@@ -0,0 +1,201 @@
+import gc
+import json
+import os
+import weakref
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, List
+
+import pytest
+
+from aihack.core import context
+from aihack.core.context import (
+    BasicContextEngine,
+    BasicSessionManager,
+    ContextSegment,
+    ContextType,
+)
+
+
+def test_optimize_context_counts_separators_toward_max_length() -> None:
+    segments = [
+        ContextSegment("a" * 40, ContextType.STRATEGIC, 1.0, datetime.now()),
+        ContextSegment("b" * 40, ContextType.IMPLEMENTATION, 0.8, datetime.now()),
+        ContextSegment("c" * 20, ContextType.CHAT, 0.3, datetime.now()),
+    ]
+
+    content = BasicContextEngine().optimize_context(segments, max_length=100)
+
+    # The third segment only fits if the joining newlines are ignored
+    assert content == "a" * 40 + "\n" + "b" * 40
+    assert len(content) <= 100
+
+
+SAMPLE_SESSIONS = {"s1": {"context": "user: héllo ✨", "message_count": 1}}
+
+
+def test_session_json_stdlib_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(context, "_HAS_ORJSON", False)
+
+    encoded = context._encode_json(SAMPLE_SESSIONS)
+
+    assert encoded == json.dumps(
+        SAMPLE_SESSIONS, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+    assert context._decode_json(encoded) == SAMPLE_SESSIONS
+    with pytest.raises(json.JSONDecodeError):
+        context._decode_json(b"{not json")
+
+
+def test_session_json_orjson_path_matches_stdlib(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    assert context._HAS_ORJSON  # orjson is a dev dependency
+    # Values and keys where orjson's defaults differ from json.dumps
+    data = {
+        **SAMPLE_SESSIONS,
+        "s2": {"last_updated": datetime(2024, 1, 2, 3, 4, 5), 7: "int key"},
+    }
+    monkeypatch.setattr(context, "_HAS_ORJSON", False)
+    stdlib_encoded = context._encode_json(data)
+    monkeypatch.setattr(context, "_HAS_ORJSON", True)
+
+    encoded = context._encode_json(data)
+
+    assert encoded == stdlib_encoded
+    assert context._decode_json(encoded) == json.loads(stdlib_encoded)
+    assert context._decode_json(encoded)["s2"] == {
+        "last_updated": "2024-01-02 03:04:05",
+        "7": "int key",
+    }
+    with pytest.raises(json.JSONDecodeError):
+        context._decode_json(b"{not json")
+
+
+class FakeTimer:
+    """Stand-in for threading.Timer that only fires when told to."""
+
+    created: List["FakeTimer"] = []
+
+    def __init__(self, interval: float, function: Callable[[], None]) -> None:
+        self.interval = interval
+        self.function = function
+        self.daemon = False
+        self.started = False
+        self.cancelled = False
+        FakeTimer.created.append(self)
+
+    def start(self) -> None:
+        self.started = True
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+@pytest.fixture
+def session_clock(monkeypatch: pytest.MonkeyPatch) -> List[float]:
+    """Pin time.monotonic for the session manager; bump now[0] to advance."""
+    now = [100.0]
+    monkeypatch.setattr(context.time, "monotonic", lambda: now[0])
+    FakeTimer.created = []
+    monkeypatch.setattr(context.threading, "Timer", FakeTimer)
+    return now
+
+
+def test_session_saves_within_interval_are_coalesced(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, session_clock: List[float]
+) -> None:
+    manager = BasicSessionManager(str(tmp_path))
+    sessions_file = tmp_path / "sessions.json"
+    writes: List[Any] = []
+    real_replace = os.replace
+
+    def counting_replace(src: Any, dst: Any) -> None:
+        writes.append(dst)
+        real_replace(src, dst)
+
+    monkeypatch.setattr(context.os, "replace", counting_replace)
+
+    for i in range(5):
+        session_clock[0] += 0.1
+        manager.save_session_context("s1", f"user: message {i}", "local")
+    assert len(writes) == 1
+    saved = json.loads(sessions_file.read_text())
+    assert saved["s1"]["context"] == "user: message 0"
+    assert manager.restore_session_context("s1") == ("user: message 4", "local")
+
+    # The rest waits for a single trailing write when the interval ends
+    [timer] = FakeTimer.created
+    assert timer.started and timer.daemon
+    assert timer.interval == pytest.approx(1.9)  # Measured from the first write
+
+    session_clock[0] += timer.interval
+    timer.function()
+    assert len(writes) == 2
+    saved = json.loads(sessions_file.read_text())
+    assert saved["s1"]["context"] == "user: message 4"
+
+    # Nothing pending, so another flush doesn't write
+    manager.flush()
+    assert len(writes) == 2
+
+    # Once the interval has passed, the next save goes straight to disk
+    session_clock[0] += manager.SAVE_INTERVAL_SECONDS
+    manager.save_session_context("s2", "user: later", "claude")
+    assert len(writes) == 3
+    assert len(FakeTimer.created) == 1
+
+
+def test_flush_cancels_pending_trailing_write(
+    tmp_path: Path, session_clock: List[float]
+) -> None:
+    manager = BasicSessionManager(str(tmp_path))
+    manager.save_session_context("s1", "user: hi", "local")
+    manager.save_session_context("s2", "user: again", "claude")
+    [timer] = FakeTimer.created
+
+    manager.flush()
+
+    assert timer.cancelled
+    assert "s2" in json.loads((tmp_path / "sessions.json").read_text())
+
+
+def test_pending_sessions_flush_at_exit_without_pinning_managers(
+    tmp_path: Path, session_clock: List[float]
+) -> None:
+    manager = BasicSessionManager(str(tmp_path))
+    manager.save_session_context("s1", "user: hi", "local")
+    manager.save_session_context("s2", "user: again", "claude")
+
+    context._flush_session_managers()
+    assert "s2" in json.loads((tmp_path / "sessions.json").read_text())
+
+    # The exit hook holds managers weakly, so dropping one frees it
+    manager_ref = weakref.ref(manager)
+    FakeTimer.created = []
+    del manager
+    gc.collect()
+    assert manager_ref() is None
+
+
+def test_failed_session_write_keeps_previous_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    manager = BasicSessionManager(str(tmp_path))
+    sessions_file = tmp_path / "sessions.json"
+    manager.save_session_context("s1", "user: hi", "local")
+    original = sessions_file.read_bytes()
+
+    def failing_replace(src: Any, dst: Any) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(context.os, "replace", failing_replace)
+    manager.save_session_context("s2", "user: again", "claude")
+    manager.flush()
+
+    assert sessions_file.read_bytes() == original
+
+    # The change is still pending and goes out on the next successful flush
+    monkeypatch.undo()
+    manager.flush()
+    assert "s2" in json.loads(sessions_file.read_text())
@@ -0,0 +1,22 @@
+from pathlib import Path
+
+import pytest
+
+from aihack.core.utils.fs.file_index import FileSystemIndex
+
+
+@pytest.mark.asyncio
+async def test_fuzzy_matches_use_prefix_index(tmp_path: Path) -> None:
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "session.py").write_text("x = 1\n")
+    (tmp_path / "src" / "service.py").write_text("y = 2\n")
+    (tmp_path / "notes.md").write_text("# notes\n")
+
+    index = FileSystemIndex(str(tmp_path))
+    await index.initialize()
+
+    assert list(index._segments_with_prefix("se")) == ["service.py", "session.py"]
+
+    paths = [path for path, _ in index.get_fuzzy_matches("sess")]
+    assert paths[0] == "src/session.py"
+    assert "notes.md" not in paths
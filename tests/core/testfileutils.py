@@ -0,0 +1,23 @@
+from pathlib import Path
+
+import pytest
+
+from aihack.core.utils.fs import file_utils
+
+
+def test_project_directories_reuse_cached_walk(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "src").mkdir()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(file_utils, "_listing_cache", {})
+
+    assert file_utils._get_project_directories() == ["src/"]
+
+    # Within the TTL a new directory isn't seen: the first walk is reused
+    (tmp_path / "docs").mkdir()
+    assert file_utils._get_project_directories() == ["src/"]
+
+    # Once the listing is stale the project is walked again
+    monkeypatch.setattr(file_utils, "_LISTING_TTL_SECONDS", -1.0)
+    assert sorted(file_utils._get_project_directories()) == ["docs/", "src/"]
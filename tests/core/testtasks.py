@@ -0,0 +1,14 @@
+import pytest
+
+from aihack.core.tasks import TaskRegistry
+
+
+@pytest.mark.parametrize("task", ["review", "analyse", "no-such-task"])
+def test_task_config_cannot_be_changed_by_callers(task: str) -> None:
+    config = TaskRegistry.get_task_config(task)
+    description = config["description"]
+
+    with pytest.raises(TypeError):
+        config["description"] = "changed"  # type: ignore[index]
+
+    assert TaskRegistry.get_task_config(task)["description"] == description
@@ -1,7 +1,9 @@
 from unittest.mock import AsyncMock, Mock
 
+import httpx
 import pytest
 
+from aihack.models.base import ModelUnavailableError
 from aihack.models.local import OllamaModel
 
 
@@ -77,3 +79,56 @@ async def test_ollama_generate_error_handling() -> None:
         await agent.generate("test prompt")
 
     assert "Network error" in str(excinfo.value)
+
+
+@pytest.mark.asyncio
+async def test_ollama_generate_connection_refused() -> None:
+    # A refused connection should surface as ModelUnavailableError
+    mock_client = Mock()
+    mock_client.post = AsyncMock(side_effect=httpx.ConnectError("Connection refused"))
+
+    agent = OllamaModel()
+    agent.client = mock_client
+
+    with pytest.raises(ModelUnavailableError):
+        await agent.generate("test prompt")
+
+
+@pytest.mark.asyncio
+async def test_ollama_code_review_stream() -> None:
+    # Ollama streams newline-delimited JSON chunks until "done" is set
+    body = (
+        '{"response": "Looks ", "done": false}\n'
+        '{"response": "fine.", "done": false}\n'
+        '{"response": "", "done": true}\n'
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/api/generate"
+        assert b'"stream": true' in request.content
+        return httpx.Response(200, text=body)
+
+    agent = OllamaModel()
+    agent.client = httpx.AsyncClient(
+        base_url=agent.base_url, transport=httpx.MockTransport(handler)
+    )
+
+    tokens = [token async for token in agent.code_review_stream("x = 1", "review")]
+
+    assert tokens == ["Looks ", "fine."]
+
+
+@pytest.mark.asyncio
+async def test_ollama_stream_connect_timeout_is_unavailable() -> None:
+    # A blackholed host times out while connecting: Ollama isn't reachable
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectTimeout("timed out", request=request)
+
+    agent = OllamaModel()
+    agent.client = httpx.AsyncClient(
+        base_url=agent.base_url, transport=httpx.MockTransport(handler)
+    )
+
+    with pytest.raises(ModelUnavailableError):
+        async for _ in agent.code_review_stream("x = 1", "review"):
+            pass